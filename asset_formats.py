@@ -0,0 +1,93 @@
+# asset_formats.py
+
+import numpy as np
+import pygame
+
+# Blit formats, cheapest first
+OPAQUE = "opaque"      # Display format, a plain copy
+COLORKEY = "colorkey"  # Hard-edged pixel art: one transparent colour, run-length encoded
+ALPHA = "alpha"        # Soft edges that need per-pixel alpha
+
+KEY_COLOR = (255, 0, 255)
+RLE_TRANSPARENT_SHARE = 0.25  # Alpha sprites at least this transparent skip the empty runs with RLE
+
+def classify(surface):
+    """Pick the cheapest blit format that keeps the surface's pixels intact."""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return COLORKEY if surface.get_colorkey() is not None else OPAQUE
+    alpha = pygame.surfarray.array_alpha(surface)
+    if alpha.min() == 255:
+        return OPAQUE
+    if np.isin(alpha, (0, 255)).all():
+        return COLORKEY
+    return ALPHA
+
+def free_key_color(surface, alpha):
+    """A colour no visible pixel uses, magenta when possible."""
+    rgb = pygame.surfarray.array3d(surface)[alpha > 0].astype(np.uint32)
+    used = np.unique((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2])
+    packed = (KEY_COLOR[0] << 16) | (KEY_COLOR[1] << 8) | KEY_COLOR[2]
+    if packed in used:
+        # Some value up to len(used) is always missing from the sorted unique colours
+        packed = int(np.setdiff1d(np.arange(len(used) + 1), used)[0])
+    return ((packed >> 16) & 255, (packed >> 8) & 255, packed & 255)
+
+def optimize_surface(surface):
+    """Return a copy of surface in its cheapest blit format, ready for the display."""
+    kind = classify(surface)
+    if kind == OPAQUE:
+        return surface.convert()
+    if kind == ALPHA:
+        optimized = surface.convert_alpha()
+        alpha = pygame.surfarray.array_alpha(optimized)
+        if (alpha == 0).mean() >= RLE_TRANSPARENT_SHARE:
+            optimized.set_alpha(255, pygame.RLEACCEL)
+        return optimized
+    if not surface.get_flags() & pygame.SRCALPHA:
+        # Already keyed; just encode it
+        optimized = surface.convert()
+        optimized.set_colorkey(surface.get_colorkey(), pygame.RLEACCEL)
+        return optimized
+
+    alpha = pygame.surfarray.array_alpha(surface)
+    key = free_key_color(surface, alpha)
+    optimized = surface.convert()
+    pixels = pygame.surfarray.pixels2d(optimized)
+    pixels[alpha == 0] = optimized.map_rgb(key)
+    del pixels  # Release the pixel lock before encoding
+    optimized.set_colorkey(key, pygame.RLEACCEL)
+    return optimized
+
+def load_image(path):
+    """Load an image straight into its cheapest blit format."""
+    return optimize_surface(pygame.image.load(path))
+
+def blit_throughput(surface, target, seconds=0.2):
+    """Blits of surface onto target per millisecond."""
+    clock = pygame.time.get_ticks
+    positions = [(x, y) for x in range(0, target.get_width(), 97) for y in range(0, target.get_height(), 89)]
+    count = 0
+    start = clock()
+    while clock() - start < seconds * 1000:
+        target.blits([(surface, position) for position in positions], doreturn=False)
+        count += len(positions)
+    return count / max(1, clock() - start)
+
+if __name__ == "__main__":
+    import os
+    from utils import resource_path
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    target = pygame.Surface((800, 600)).convert()
+    image_dir = resource_path("images")
+    print(f"{'asset':30}{'size':>12}  {'format':9}{'before':>12}{'after':>12}   blits/ms")
+    for name in sorted(os.listdir(image_dir)):
+        loaded = pygame.image.load(os.path.join(image_dir, name))
+        # Large art is drawn as full-screen backdrops, so measure it at that size
+        if max(loaded.get_size()) > 256:
+            loaded = pygame.transform.scale(loaded, target.get_size())
+        before = blit_throughput(loaded.convert_alpha(), target)
+        after = blit_throughput(optimize_surface(loaded), target)
+        size = f"{loaded.get_width()}x{loaded.get_height()}"
+        print(f"{name:30}{size:>12}  {classify(loaded):9}{before:>12.1f}{after:>12.1f}   x{after / before:.2f}")
+    pygame.quit()
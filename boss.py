@@ -1,5 +1,6 @@
 import pygame  # Ensure pygame is imported
 import os
+from frame_bank import FRAME_BANK
 
 class Boss:
     def __init__(self, sprite_sheet_path, position=(0, 0), scale_factor=3, frame_rows=1, frame_cols=1, animation_speed=100, flip=False):
@@ -26,19 +27,13 @@ class Boss:
 
     def load_frames(self):
         """
-        Load frames from the sprite sheet.
+        Load frames from the sprite sheet through the shared frame bank.
         """
-        sprite_sheet = pygame.image.load(self.sprite_sheet_path).convert_alpha()
-        sprite_width, sprite_height = sprite_sheet.get_size()
-        self.frame_width = sprite_width // self.frame_cols
-        self.frame_height = sprite_height // self.frame_rows
+        _, self.frame_width, self.frame_height = FRAME_BANK.load_sheet(self.sprite_sheet_path, self.frame_rows, self.frame_cols)
 
         for row in range(self.frame_rows):
             for col in range(self.frame_cols):
-                frame = sprite_sheet.subsurface(
-                    (col * self.frame_width, row * self.frame_height, self.frame_width, self.frame_height)
-                )
-                self.frames.append(frame)
+                self.frames.append((row, col))
 
     def set_position(self, x, y):
         """Set the boss's position."""
@@ -73,11 +68,9 @@ class Boss:
 
     def draw(self, screen, scale_factor=None):
         """Render the boss."""
-        frame = self.frames[self.current_frame]
-        if self.flip:
-            frame = pygame.transform.flip(frame, True, False)
+        row, col = self.frames[self.current_frame]
         scale = scale_factor or self.scale_factor
-        scaled_frame = pygame.transform.scale(frame, (int(self.frame_width * scale), int(self.frame_height * scale)))
+        scaled_frame = FRAME_BANK.frame(self.sprite_sheet_path, row, col, scale, self.flip)
         draw_x = self.position[0] - scaled_frame.get_width() // 2
         draw_y = self.position[1] - scaled_frame.get_height() // 2
         screen.blit(scaled_frame, (draw_x, draw_y))
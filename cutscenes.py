@@ -1,61 +1,93 @@
 import pygame
 import sys
 from typing import List, Optional, Tuple
-from utils import render_text_wrapped, resource_path, WHITE, YELLOW, BLACK
+from utils import resource_path, WHITE, YELLOW, BLACK
 from boss import Boss
+from frame_bank import FRAME_BANK
+from transitions import TransitionCompositor, fade_duration
+from layers import LayerStack
+from pages import PAGE_CACHE
+from text_layout import TEXT_LAYOUT
+from asset_formats import load_image, optimize_surface
 
 # --- Constants ---
 DIALOGUE_BOX_ALPHA = 180
-FADE_MAX = 255
 DIALOGUE_BOX_MARGIN = 50
 DIALOGUE_BOX_HEIGHT = 100
 PROMPT_Y_OFFSET = 80
 IDLE_AMPLITUDE = 5
 IDLE_SPEED = 0.1
+DOPAMAN_SHEET = 'images/dopaman.png'
+DOPAMAN_FRAME_COLS = 8
+DOPAMAN_CUTSCENE_SCALE = 3
+
+_dialogue_backgrounds = {}  # Box size -> translucent dialogue box background
 
 # --- Helper Functions ---
-def extract_frames(sprite_sheet: pygame.Surface, frame_width: int, frame_height: int, num_frames: int, row: int = 0) -> List[pygame.Surface]:
-    """Extracts frames from a sprite sheet."""
-    frames = []
-    for col in range(num_frames):
-        frame_rect = pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
-        frames.append(sprite_sheet.subsurface(frame_rect))
-    return frames
+def load_dopaman_frames(scale: float = DOPAMAN_CUTSCENE_SCALE, flip: bool = False) -> List[pygame.Surface]:
+    """Returns Dopaman's animation frames from the shared frame bank."""
+    path = resource_path(DOPAMAN_SHEET)
+    FRAME_BANK.load_sheet(path, 1, DOPAMAN_FRAME_COLS)
+    return FRAME_BANK.frames(path, 0, range(DOPAMAN_FRAME_COLS), scale, flip)
 
 def scale_surface(surface: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
     """Scales a surface to the given size."""
     return pygame.transform.scale(surface, size)
 
-def draw_fade(surface: pygame.Surface, color: Tuple[int, int, int], alpha: int):
-    fade_surface = pygame.Surface(surface.get_size())
-    fade_surface.set_alpha(alpha)
-    fade_surface.fill(color)
-    surface.blit(fade_surface, (0, 0))
+def present_frame(surface: pygame.Surface, screen: pygame.Surface, presenter=None):
+    """Shows a finished frame, through the game's presenter when one is given."""
+    if presenter is not None:
+        presenter.present(surface)
+        return
+    if surface is not screen:
+        screen.blit(surface, (0, 0))
+    pygame.display.flip()
+
+def run_cutscene(cutscene, fps: int = 60):
+    """Plays a cutscene generator to the end in a loop of its own, outside the game's scene stack."""
+    clock = pygame.time.Clock()
+    frame = None  # The first send only runs the setup up to the opening frame
+    while True:
+        try:
+            cutscene.send(frame)
+        except StopIteration:
+            return
+        dt = clock.tick(fps)
+        events = pygame.event.get()
+        if any(event.type == pygame.QUIT for event in events):
+            pygame.quit()
+            sys.exit()
+        frame = (dt, events)
 
-def draw_dialogue_box(surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int], screen: pygame.Surface):
-    text_rect = pygame.Rect(DIALOGUE_BOX_MARGIN, screen.get_height() - DIALOGUE_BOX_HEIGHT - DIALOGUE_BOX_MARGIN, screen.get_width() - 2 * DIALOGUE_BOX_MARGIN, DIALOGUE_BOX_HEIGHT)
-    text_background = pygame.Surface((text_rect.width, text_rect.height), pygame.SRCALPHA)
-    text_background.fill((0, 0, 0, DIALOGUE_BOX_ALPHA))
+def draw_dialogue_box(surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int]):
+    text_rect = pygame.Rect(DIALOGUE_BOX_MARGIN, surface.get_height() - DIALOGUE_BOX_HEIGHT - DIALOGUE_BOX_MARGIN, surface.get_width() - 2 * DIALOGUE_BOX_MARGIN, DIALOGUE_BOX_HEIGHT)
+    text_background = _dialogue_backgrounds.get(text_rect.size)
+    if text_background is None:
+        text_background = pygame.Surface(text_rect.size, pygame.SRCALPHA)
+        text_background.fill((0, 0, 0, DIALOGUE_BOX_ALPHA))
+        _dialogue_backgrounds[text_rect.size] = text_background
     surface.blit(text_background, text_rect.topleft)
-    render_text_wrapped(surface, text, font, color, text_rect)
+    # The wrapped line is rendered once and reused until the dialogue advances
+    TEXT_LAYOUT.draw(surface, text, font, color, text_rect)
 
 def load_and_scale_image(path: str, size: Tuple[int, int]) -> pygame.Surface:
     try:
-        img = pygame.image.load(resource_path(path)).convert_alpha()
-        return scale_surface(img, size)
+        # Scale the raw image first so the format pass sees the final pixels
+        img = pygame.image.load(resource_path(path))
+        return optimize_surface(scale_surface(img, size))
     except pygame.error as e:
         print(f"Error loading image {path}: {e}")
         pygame.quit()
         sys.exit()
 
-def draw_prompt(surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int], screen: pygame.Surface, y_offset: int = PROMPT_Y_OFFSET):
-    """Draws a prompt (e.g., 'Press Enter to continue...') centered at the bottom of the screen."""
+def draw_prompt(surface: pygame.Surface, text: str, font: pygame.font.Font, color: Tuple[int, int, int], y_offset: int = PROMPT_Y_OFFSET):
+    """Draws a prompt (e.g., 'Press Enter to continue...') centered at the bottom of the surface."""
     prompt_text = font.render(text, True, color)
-    prompt_rect = prompt_text.get_rect(center=(screen.get_width() // 2, screen.get_height() - y_offset))
+    prompt_rect = prompt_text.get_rect(center=(surface.get_width() // 2, surface.get_height() - y_offset))
     surface.blit(prompt_text, prompt_rect)
 
 # --- Main Cutscene Functions ---
-def show_level_story(
+def play_level_story(
     game_surface: pygame.Surface,
     screen: pygame.Surface,
     level: int,
@@ -65,28 +97,23 @@ def show_level_story(
     retro_bg_color: Tuple[int, int, int],
     player_image: pygame.Surface,
     mjf_helper_image: pygame.Surface,
-    enemy_image: pygame.Surface
+    enemy_image: pygame.Surface,
+    presenter=None
 ):
-    """Handles the display of the story and cutscenes for each level."""
+    """Plays the story and cutscenes for each level.
+
+    Cutscenes are generators driven by the caller's frame loop: each frame sends
+    (elapsed_ms, events) in, and the cutscene draws and presents one frame.
+    """
     fade_speed = 5
-    dopaman_spritesheet = pygame.image.load(resource_path('images/dopaman.png')).convert_alpha()
-    frame_cols = 8
-    sheet_width, sheet_height = dopaman_spritesheet.get_size()
-    frame_width = sheet_width // frame_cols
-    frame_height = sheet_height
-    dopaman_frames = extract_frames(dopaman_spritesheet, frame_width, frame_height, frame_cols, row=0)
-    dopaman_scale_factor = 3
-    dopaman_frames = [pygame.transform.scale(
-        frame,
-        (int(frame_width * dopaman_scale_factor), int(frame_height * dopaman_scale_factor))
-    ) for frame in dopaman_frames]
+    dopaman_frames = load_dopaman_frames()
     boss = None
     boss_scale_factor = 1
     if level == 2:
-        dopaman_y = screen.get_height() // 2
+        dopaman_y = game_surface.get_height() // 2
         boss = Boss(
             resource_path("images/boss.png"),
-            position=(screen.get_width() * 0.7, dopaman_y),
+            position=(game_surface.get_width() * 0.7, dopaman_y),
             scale_factor=4,
             frame_rows=1,
             frame_cols=50,
@@ -95,42 +122,44 @@ def show_level_story(
         )
         boss_scale_factor = 4
     if level == 1:
-        show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed, level=1)
+        yield from play_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed, level=1, presenter=presenter)
     elif level == 2:
-        show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed, level=2, boss=boss, boss_scale_factor=boss_scale_factor)
+        yield from play_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed, level=2, boss=boss, boss_scale_factor=boss_scale_factor, presenter=presenter)
     elif level == 3:
-        show_cutscene_3(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed)
+        yield from play_cutscene_3(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed, presenter)
     elif level == 4:
-        show_cutscene_4(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed)
-    show_educational_content(game_surface, screen, level, EDUCATIONAL_CONTENT, retro_small_font, retro_bg_color, fade_speed)
+        yield from play_cutscene_4(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed, presenter)
+    yield from play_educational_content(game_surface, screen, level, EDUCATIONAL_CONTENT, retro_small_font, retro_bg_color, fade_speed, presenter)
 
-def show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed, level, boss=None, boss_scale_factor=1):
+def play_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, fade_speed, level, boss=None, boss_scale_factor=1, presenter=None):
     """Displays a cutscene for the given level."""
-    clock = pygame.time.Clock()
-    fade_alpha = FADE_MAX
+    transition = TransitionCompositor(game_surface.get_size(), retro_bg_color)
     showing_cutscene = True
     dialogue_index = 0
     animation_timer = 0
     animation_interval = 100
     current_frame_index = 0
-    screen_center_x = screen.get_width() // 2
-    dopaman_pos = [screen_center_x, screen.get_height() // 2]
+    screen_center_x = game_surface.get_width() // 2
+    dopaman_pos = [screen_center_x, game_surface.get_height() // 2]
     dopaman_velocity = 2
     dopaman_direction = 1
-    dopaman_move_range = screen.get_width() * 0.25
+    dopaman_move_range = game_surface.get_width() * 0.25
     dopaman_start_x = dopaman_pos[0]
     if level == 2 and boss is None:
         return
+    # Mirrored frames come pre-built from the frame bank
+    dopaman_frames_flipped = load_dopaman_frames(flip=True)
     dialogue = []
-    background_layer = None
+    # Static backdrop layers are flattened into one composite on first draw
+    scenery = LayerStack(game_surface.get_size(), retro_bg_color)
     if level == 1:
         dialogue = [
             "Dopaman: I am Dopaman, the guardian of balance in this bustling city.",
             "Without me, communication falters, and Neurocity falls into disarray."
         ]
-        background_layer = load_and_scale_image('images/sjy.png', (screen.get_width(), screen.get_height()))
-        middle_layer = load_and_scale_image('images/city.png', (screen.get_width(), screen.get_height()))
-        foreground_layer = load_and_scale_image('images/illustration.png', (screen.get_width(), screen.get_height()))
+        scenery.add(load_and_scale_image('images/sjy.png', (game_surface.get_width(), game_surface.get_height())))
+        scenery.add(load_and_scale_image('images/city.png', (game_surface.get_width(), game_surface.get_height())))
+        scenery.add(load_and_scale_image('images/illustration.png', (game_surface.get_width(), game_surface.get_height())))
     elif level == 2:
         dialogue = [
             "Dopaman: Something feels wrong... The CNS towers are damaged!",
@@ -138,14 +167,15 @@ def show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopama
             "Dopaman: Parkinon, my nemesis! How did you get here?! I must stabilize the towers before it's too late!",
             ""
         ]
-        background_layer = load_and_scale_image('images/substantia_nigra_towers.png', (screen.get_width(), screen.get_height()))
+        scenery.add(load_and_scale_image('images/substantia_nigra_towers.png', (game_surface.get_width(), game_surface.get_height())))
     boss_jumping = False
     boss_jump_timer = 0
+    boss_turn_wait = 0  # Milliseconds the boss holds still after turning, before it jumps
     JUMP_DURATION = 2000
     if level == 2:
         boss_jump = Boss(
             resource_path("images/boss-jump.png"),
-            position=(screen.get_width() * 0.7, dopaman_pos[1]),
+            position=(game_surface.get_width() * 0.7, dopaman_pos[1]),
             scale_factor=4,
             frame_rows=1,
             frame_cols=12,
@@ -159,34 +189,12 @@ def show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopama
     chase_jump_duration = 2500
     original_dopaman_y = dopaman_pos[1]
     boss_offscreen = False
-    # Fade-in at the start
-    while fade_alpha > 0:
-        game_surface.fill(retro_bg_color)
-        if background_layer:
-            game_surface.blit(background_layer, (0, 0))
-            if level == 1:
-                game_surface.blit(middle_layer, (0, 0))
-                game_surface.blit(foreground_layer, (0, 0))
-        dopaman_frame = dopaman_frames[0]
-        game_surface.blit(
-            dopaman_frame,
-            (
-                dopaman_pos[0] - dopaman_frame.get_width() // 2,
-                dopaman_pos[1] - dopaman_frame.get_height() // 2
-            )
-        )
-        draw_fade(game_surface, retro_bg_color, fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
-        fade_alpha = max(0, fade_alpha - fade_speed)
-    fade_alpha = 0
+    # Fade in over the opening frames
+    transition.start(fade_in=True, duration=fade_duration(fade_speed))
     while showing_cutscene:
-        dt = clock.tick(60)
+        dt, events = yield
         animation_timer += dt
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        for event in events:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                 if level == 2 and dialogue_index == len(dialogue) - 1:
                     if not boss.jumping:
@@ -196,24 +204,20 @@ def show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopama
                     dialogue_index += 1
                     if dialogue_index >= len(dialogue):
                         showing_cutscene = False
-        game_surface.fill(retro_bg_color)
+        scenery.draw(game_surface, dt)
         if animation_timer >= animation_interval:
             current_frame_index = (current_frame_index + 1) % len(dopaman_frames)
             animation_timer = 0
-        if background_layer:
-            game_surface.blit(background_layer, (0, 0))
-            if level == 1:
-                game_surface.blit(middle_layer, (0, 0))
-                game_surface.blit(foreground_layer, (0, 0))
         if level == 1:
             new_x = dopaman_pos[0] + (dopaman_velocity * dopaman_direction)
             if abs(new_x - screen_center_x) < dopaman_move_range:
                 dopaman_pos[0] = new_x
             else:
                 dopaman_direction *= -1
-            dopaman_frame = dopaman_frames[current_frame_index]
             if dopaman_direction == -1:
-                dopaman_frame = pygame.transform.flip(dopaman_frame, True, False)
+                dopaman_frame = dopaman_frames_flipped[current_frame_index]
+            else:
+                dopaman_frame = dopaman_frames[current_frame_index]
         else:
             dopaman_frame = dopaman_frames[current_frame_index]
         game_surface.blit(
@@ -225,16 +229,19 @@ def show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopama
         )
         if boss and level == 2:
             if dialogue_index >= len(dialogue) - 1:
-                if not boss.jumping:
-                    if boss.flip:
-                        boss.flip = False
-                        pygame.time.wait(300)
+                if boss.flip:
+                    # Turn round, then keep playing frames for a moment before the jump
+                    boss.flip = False
+                    boss_turn_wait = 300
+                elif boss_turn_wait > 0:
+                    boss_turn_wait -= dt
+                elif not boss.jumping:
                     boss = boss_jump
                     boss.start_jump()
             jump_completed = boss.update(dt)
             boss.draw(game_surface, scale_factor=boss_scale_factor)
             if jump_completed:
-                if boss.position[0] > screen.get_width() * 1.2:
+                if boss.position[0] > game_surface.get_width() * 1.2:
                     boss_offscreen = True
             if boss_offscreen and not dopaman_chasing:
                 dopaman_chasing = True
@@ -245,25 +252,16 @@ def show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopama
                 dopaman_pos[1] = original_dopaman_y + (chase_jump_height * progress * (1 - progress) * 4)
                 dopaman_pos[0] += chase_speed
                 dopaman_frame = dopaman_frames[current_frame_index]
-            if boss_offscreen and dopaman_pos[0] > screen.get_width() * 1.2:
+            if boss_offscreen and dopaman_pos[0] > game_surface.get_width() * 1.2:
                 showing_cutscene = False
         if dialogue_index < len(dialogue):
-            draw_dialogue_box(game_surface, dialogue[dialogue_index], retro_small_font, WHITE, screen)
-        if fade_alpha < FADE_MAX:
-            fade_alpha = min(FADE_MAX, fade_alpha + fade_speed)
-            draw_fade(game_surface, retro_bg_color, FADE_MAX - fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
+            draw_dialogue_box(game_surface, dialogue[dialogue_index], retro_small_font, WHITE)
+        transition.apply(game_surface)
+        present_frame(game_surface, screen, presenter)
     # Fade-out at the end
-    fade_alpha = 0
-    while fade_alpha < FADE_MAX:
-        game_surface.fill(retro_bg_color)
-        if background_layer:
-            game_surface.blit(background_layer, (0, 0))
-            if level == 1:
-                game_surface.blit(middle_layer, (0, 0))
-                game_surface.blit(foreground_layer, (0, 0))
-        game_surface.blit(
+    def draw_final_frame(surface):
+        scenery.draw(surface)
+        surface.blit(
             dopaman_frame,
             (
                 dopaman_pos[0] - dopaman_frame.get_width() // 2,
@@ -271,100 +269,69 @@ def show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopama
             )
         )
         if boss and level == 2:
-            boss.draw(game_surface, scale_factor=boss_scale_factor)
-        draw_fade(game_surface, retro_bg_color, fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
-        fade_alpha = min(FADE_MAX, fade_alpha + fade_speed)
+            boss.draw(surface, scale_factor=boss_scale_factor)
+    yield from transition.frames(game_surface, draw_final_frame, lambda surface: present_frame(surface, screen, presenter), fade_in=False, duration=fade_duration(fade_speed))
 
-def show_educational_content(
+def play_educational_content(
     game_surface: pygame.Surface,
     screen: pygame.Surface,
     level: int,
     EDUCATIONAL_CONTENT: dict,
     retro_small_font: pygame.font.Font,
     retro_bg_color: Tuple[int, int, int],
-    fade_speed: int
+    fade_speed: int,
+    presenter=None
 ):
     """Displays educational content related to the current level."""
-    clock = pygame.time.Clock()
-    fade_alpha = FADE_MAX
-    educational_text = EDUCATIONAL_CONTENT.get(level, [])
+    transition = TransitionCompositor(game_surface.get_size(), retro_bg_color)
     showing_education = True
     y_offset = 150
     text_rect = pygame.Rect(
-        50, y_offset, screen.get_width() - 100, screen.get_height() - y_offset - 100
+        50, y_offset, game_surface.get_width() - 100, game_surface.get_height() - y_offset - 100
     )
-    wrapped_lines = []
-    words = " ".join(educational_text).split()
-    line = ""
-    for word in words:
-        test_line = line + word + " "
-        text_width, _ = retro_small_font.size(test_line)
-        if text_width < text_rect.width:
-            line = test_line
-        else:
-            wrapped_lines.append(line.strip())
-            line = word + " "
-    if line:
-        wrapped_lines.append(line.strip())
-    current_line_index = 0
-    # Fade-in at the start
-    while fade_alpha > 0:
-        screen.fill(retro_bg_color)
-        draw_fade(screen, retro_bg_color, fade_alpha)
-        pygame.display.flip()
-        fade_alpha = max(0, fade_alpha - fade_speed)
-    fade_alpha = 0
+    # Pages are laid out once per level, resolution and font, so page flips only blit
+    pages = PAGE_CACHE.wrapped(level, EDUCATIONAL_CONTENT.get(level, []), retro_small_font, WHITE, retro_bg_color, game_surface.get_size(), text_rect)
+    page_index = 0
+
+    def draw_page(surface):
+        surface.blit(pages[page_index], (0, 0))
+
+    def present(surface):
+        present_frame(surface, screen, presenter)
+
+    # Fade in over the first page
+    transition.start(fade_in=True, duration=fade_duration(fade_speed))
     while showing_education:
-        dt = clock.tick(60)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        dt, events = yield
+        for event in events:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                current_line_index += 1
-                if current_line_index * (text_rect.height // (retro_small_font.get_linesize() + 10)) >= len(wrapped_lines):
+                if page_index + 1 < len(pages):
+                    page_index += 1
+                else:
                     showing_education = False
-        screen.fill(retro_bg_color)
-        line_height = retro_small_font.get_linesize() + 10
-        current_y = text_rect.top
-        for i in range(current_line_index * (text_rect.height // line_height), len(wrapped_lines)):
-            line = wrapped_lines[i]
-            if current_y + line_height > text_rect.bottom:
-                break
-            rendered_line = retro_small_font.render(line, True, WHITE)
-            screen.blit(rendered_line, (text_rect.left, current_y))
-            current_y += line_height
-        draw_prompt(screen, "Press Enter to continue...", retro_small_font, YELLOW, screen)
-        if fade_alpha < FADE_MAX:
-            fade_alpha = min(FADE_MAX, fade_alpha + fade_speed)
-            draw_fade(screen, retro_bg_color, FADE_MAX - fade_alpha)
-        pygame.display.flip()
-    # Fade-out at the end
-    fade_alpha = 0
-    while fade_alpha < FADE_MAX:
-        screen.fill(retro_bg_color)
-        draw_fade(screen, retro_bg_color, fade_alpha)
-        pygame.display.flip()
-        fade_alpha = min(FADE_MAX, fade_alpha + fade_speed)
+        draw_page(game_surface)
+        draw_prompt(game_surface, "Press Enter to continue...", retro_small_font, YELLOW)
+        transition.apply(game_surface)
+        present(game_surface)
+    # Fade the last page out
+    yield from transition.frames(game_surface, draw_page, present, fade_in=False, duration=fade_duration(fade_speed))
 
-def show_cutscene_3(game_surface: pygame.Surface, screen: pygame.Surface, retro_small_font: pygame.font.Font, retro_bg_color: Tuple[int, int, int], dopaman_frames: List[pygame.Surface], fade_speed: int):
+def play_cutscene_3(game_surface: pygame.Surface, screen: pygame.Surface, retro_small_font: pygame.font.Font, retro_bg_color: Tuple[int, int, int], dopaman_frames: List[pygame.Surface], fade_speed: int, presenter=None):
     """Displays the third cutscene where MJF dramatically meets AssistDopman."""
-    clock = pygame.time.Clock()
-    fade_alpha = 0
+    transition = TransitionCompositor(game_surface.get_size(), retro_bg_color)
+    scenery = LayerStack(game_surface.get_size(), retro_bg_color)
     try:
-        city_bg = load_and_scale_image('images/city-night.png', (screen.get_width(), screen.get_height()))
-        sky_bg = load_and_scale_image('images/sky-night.png', (screen.get_width(), screen.get_height()))
-        illustration = load_and_scale_image('images/illustration-night.png', (screen.get_width(), screen.get_height()))
-        mjf_sprite = pygame.image.load(resource_path('images/mjf.jpeg')).convert_alpha()
+        scenery.add(load_and_scale_image('images/sky-night.png', (game_surface.get_width(), game_surface.get_height())))
+        scenery.add(load_and_scale_image('images/city-night.png', (game_surface.get_width(), game_surface.get_height())))
+        scenery.add(load_and_scale_image('images/illustration-night.png', (game_surface.get_width(), game_surface.get_height())))
+        mjf_sprite = load_image(resource_path('images/mjf.jpeg'))
     except Exception as e:
         print(f"Error loading assets: {e}")
         pygame.quit()
         sys.exit()
     camera_zoom = 1.0
     mjf_y = -mjf_sprite.get_height()  # Start MJF above the screen
-    mjf_target_y = screen.get_height() // 2
+    mjf_target_y = game_surface.get_height() // 2
     mjf_entry_speed = 8  # Speed of descent
     handshake_shown = False
     # PHASES: intro -> pre_entrance -> descent -> dialogue -> handshake
@@ -391,32 +358,12 @@ def show_cutscene_3(game_surface: pygame.Surface, screen: pygame.Surface, retro_
     dopaman_idle_offset = 0
     dopaman_idle_direction = 1
     mjf_has_entered = False  # Track if MJF has finished his entrance
-    # Fade-in at the start
-    fade_alpha = FADE_MAX
-    while fade_alpha > 0:
-        game_surface.fill(retro_bg_color)
-        game_surface.blit(sky_bg, (0, 0))
-        game_surface.blit(city_bg, (0, 0))
-        game_surface.blit(illustration, (0, 0))
-        # Dopaman only for intro
-        dopaman_frame = dopaman_frames[0]
-        scaled_frame = pygame.transform.scale(
-            dopaman_frame,
-            (int(dopaman_frame.get_width() * camera_zoom), int(dopaman_frame.get_height() * camera_zoom))
-        )
-        game_surface.blit(scaled_frame, (screen.get_width()//2 - scaled_frame.get_width()//2, screen.get_height()//2 - scaled_frame.get_height()//2))
-        draw_fade(game_surface, retro_bg_color, fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
-        fade_alpha = max(0, fade_alpha - fade_speed)
-    # Start in pre_entrance phase
+    # Start in pre_entrance phase, fading in over the opening frames
     scene_phase = "pre_entrance"
+    transition.start(fade_in=True, duration=fade_duration(fade_speed))
     while showing_cutscene:
-        dt = clock.tick(60)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        dt, events = yield
+        for event in events:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                 if scene_phase == "pre_entrance":
                     dialogue_index += 1
@@ -434,10 +381,7 @@ def show_cutscene_3(game_surface: pygame.Surface, screen: pygame.Surface, retro_
                         scene_phase = "handshake"
                 elif scene_phase == "handshake":
                     showing_cutscene = False
-        game_surface.fill(retro_bg_color)
-        game_surface.blit(sky_bg, (0, 0))
-        game_surface.blit(city_bg, (0, 0))
-        game_surface.blit(illustration, (0, 0))
+        scenery.draw(game_surface, dt)
         if scene_phase == "intro":
             camera_zoom = min(camera_zoom + 0.01, 1.5)
             if camera_zoom >= 1.5:
@@ -472,49 +416,39 @@ def show_cutscene_3(game_surface: pygame.Surface, screen: pygame.Surface, retro_
                 dopaman_frame,
                 (int(dopaman_frame.get_width() * camera_zoom), int(dopaman_frame.get_height() * camera_zoom))
             )
-            game_surface.blit(scaled_frame, (screen.get_width()//2 - scaled_frame.get_width()//2, screen.get_height()//2 - scaled_frame.get_height()//2 + dopaman_idle_offset))
+            game_surface.blit(scaled_frame, (game_surface.get_width()//2 - scaled_frame.get_width()//2, game_surface.get_height()//2 - scaled_frame.get_height()//2 + dopaman_idle_offset))
         else:
-            game_surface.blit(dopaman_frame, (screen.get_width()//3, screen.get_height()//2 + dopaman_idle_offset))
+            game_surface.blit(dopaman_frame, (game_surface.get_width()//3, game_surface.get_height()//2 + dopaman_idle_offset))
         # Draw MJF: only during descent and after
         if scene_phase == "descent" or mjf_has_entered:
-            game_surface.blit(mjf_sprite, (screen.get_width()*2//3, mjf_y))
+            game_surface.blit(mjf_sprite, (game_surface.get_width()*2//3, mjf_y))
         # Draw dialogue
         if scene_phase == "pre_entrance" and dialogue_index < len(dialogue):
-            draw_dialogue_box(game_surface, dialogue[dialogue_index], retro_small_font, WHITE, screen)
+            draw_dialogue_box(game_surface, dialogue[dialogue_index], retro_small_font, WHITE)
         elif scene_phase == "descent":
-            draw_dialogue_box(game_surface, dialogue[3], retro_small_font, WHITE, screen)
+            draw_dialogue_box(game_surface, dialogue[3], retro_small_font, WHITE)
         elif scene_phase == "dialogue" and dialogue_index < len(dialogue):
-            draw_dialogue_box(game_surface, dialogue[dialogue_index], retro_small_font, WHITE, screen)
-        if fade_alpha < FADE_MAX:
-            fade_alpha = min(FADE_MAX, fade_alpha + fade_speed)
-            draw_fade(game_surface, retro_bg_color, FADE_MAX - fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
+            draw_dialogue_box(game_surface, dialogue[dialogue_index], retro_small_font, WHITE)
+        transition.apply(game_surface)
+        present_frame(game_surface, screen, presenter)
     # Fade-out at the end
-    fade_alpha = 0
-    while fade_alpha < FADE_MAX:
-        game_surface.fill(retro_bg_color)
-        game_surface.blit(sky_bg, (0, 0))
-        game_surface.blit(city_bg, (0, 0))
-        game_surface.blit(illustration, (0, 0))
+    def draw_final_frame(surface):
+        scenery.draw(surface)
         # Draw Dopaman and MJF in their final positions
-        game_surface.blit(dopaman_frame, (screen.get_width()//3, screen.get_height()//2 + dopaman_idle_offset))
+        surface.blit(dopaman_frame, (game_surface.get_width()//3, game_surface.get_height()//2 + dopaman_idle_offset))
         if mjf_has_entered:
-            game_surface.blit(mjf_sprite, (screen.get_width()*2//3, mjf_y))
-        draw_fade(game_surface, retro_bg_color, fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
-        fade_alpha = min(FADE_MAX, fade_alpha + fade_speed)
+            surface.blit(mjf_sprite, (game_surface.get_width()*2//3, mjf_y))
+    yield from transition.frames(game_surface, draw_final_frame, lambda surface: present_frame(surface, screen, presenter), fade_in=False, duration=fade_duration(fade_speed))
 
-def show_cutscene_4(game_surface: pygame.Surface, screen: pygame.Surface, retro_small_font: pygame.font.Font, retro_bg_color: Tuple[int, int, int], dopaman_frames: List[pygame.Surface], fade_speed: int):
+def play_cutscene_4(game_surface: pygame.Surface, screen: pygame.Surface, retro_small_font: pygame.font.Font, retro_bg_color: Tuple[int, int, int], dopaman_frames: List[pygame.Surface], fade_speed: int, presenter=None):
     """Displays the final cutscene where Dopaman and allies celebrate victory."""
-    clock = pygame.time.Clock()
-    fade_alpha = FADE_MAX
+    transition = TransitionCompositor(game_surface.get_size(), retro_bg_color)
     animation_timer = 0
     animation_interval = 100
     current_frame_index = 0
     num_frames = len(dopaman_frames)
-    dopaman_pos = [screen.get_width() // 2, screen.get_height() // 2]
+    dopaman_frames_flipped = load_dopaman_frames(flip=True)
+    dopaman_pos = [game_surface.get_width() // 2, game_surface.get_height() // 2]
     dopaman_velocity = 2
     dopaman_direction = 1
     dopaman_move_range = 50
@@ -525,36 +459,25 @@ def show_cutscene_4(game_surface: pygame.Surface, screen: pygame.Surface, retro_
         "but together, we've proven that adaptation and resilience",
         "can overcome the greatest challenges."
     ]
+    scenery = LayerStack(game_surface.get_size(), retro_bg_color)
     try:
-        background_layer = load_and_scale_image('images/sjy.png', (screen.get_width(), screen.get_height()))
-        middle_layer = load_and_scale_image('images/city.png', (screen.get_width(), screen.get_height()))
-        foreground_layer = load_and_scale_image('images/illustration.png', (screen.get_width(), screen.get_height()))
+        scenery.add(load_and_scale_image('images/sjy.png', (game_surface.get_width(), game_surface.get_height())))
+        scenery.add(load_and_scale_image('images/city.png', (game_surface.get_width(), game_surface.get_height())))
+        scenery.add(load_and_scale_image('images/illustration.png', (game_surface.get_width(), game_surface.get_height())))
     except Exception as e:
         print(f"Error loading images: {e}")
         pygame.quit()
         sys.exit()
-    # Fade-in at the start
-    while fade_alpha > 0:
-        game_surface.fill(retro_bg_color)
-        game_surface.blit(background_layer, (0, 0))
-        game_surface.blit(middle_layer, (0, 0))
-        game_surface.blit(foreground_layer, (0, 0))
-        game_surface.blit(dopaman_frames[0], (dopaman_pos[0] - dopaman_frames[0].get_width() // 2, dopaman_pos[1] - dopaman_frames[0].get_height() // 2))
-        draw_fade(game_surface, retro_bg_color, fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
-        fade_alpha = max(0, fade_alpha - fade_speed)
+    # Fade in over the opening frames
+    transition.start(fade_in=True, duration=fade_duration(fade_speed))
     showing_cutscene = True
     dialogue_index = 0
     dialogue_timer = 0
     dialogue_interval = 5000
     while showing_cutscene:
-        dt = clock.tick(60)
+        dt, events = yield
         animation_timer += dt
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        for event in events:
             if (
                 event.type == pygame.KEYDOWN
                 and event.key == pygame.K_RETURN
@@ -567,12 +490,11 @@ def show_cutscene_4(game_surface: pygame.Surface, screen: pygame.Surface, retro_
         dopaman_pos[0] += dopaman_velocity * dopaman_direction
         if abs(dopaman_pos[0] - dopaman_start_x) > dopaman_move_range:
             dopaman_direction *= -1
-        current_frame = dopaman_frames[current_frame_index]
         if dopaman_direction == -1:
-            current_frame = pygame.transform.flip(current_frame, True, False)
-        game_surface.blit(background_layer, (0, 0))
-        game_surface.blit(middle_layer, (0, 0))
-        game_surface.blit(foreground_layer, (0, 0))
+            current_frame = dopaman_frames_flipped[current_frame_index]
+        else:
+            current_frame = dopaman_frames[current_frame_index]
+        scenery.draw(game_surface, dt)
         game_surface.blit(
             current_frame,
             (
@@ -581,30 +503,20 @@ def show_cutscene_4(game_surface: pygame.Surface, screen: pygame.Surface, retro_
             )
         )
         if dialogue_index < len(dialogue):
-            draw_dialogue_box(game_surface, dialogue[dialogue_index], retro_small_font, WHITE, screen)
+            draw_dialogue_box(game_surface, dialogue[dialogue_index], retro_small_font, WHITE)
             dialogue_timer += dt
             if dialogue_timer >= dialogue_interval:
                 dialogue_index += 1
                 dialogue_timer = 0
         else:
-            draw_prompt(game_surface, "Press Enter to continue...", retro_small_font, YELLOW, screen, y_offset=50)
-        if fade_alpha < FADE_MAX:
-            fade_alpha = min(FADE_MAX, fade_alpha + fade_speed)
-            draw_fade(game_surface, retro_bg_color, FADE_MAX - fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
+            draw_prompt(game_surface, "Press Enter to continue...", retro_small_font, YELLOW, y_offset=50)
+        transition.apply(game_surface)
+        present_frame(game_surface, screen, presenter)
     # Fade-out at the end
-    fade_alpha = 0
-    while fade_alpha < FADE_MAX:
-        game_surface.fill(retro_bg_color)
-        game_surface.blit(background_layer, (0, 0))
-        game_surface.blit(middle_layer, (0, 0))
-        game_surface.blit(foreground_layer, (0, 0))
-        game_surface.blit(current_frame, (dopaman_pos[0] - current_frame.get_width() // 2, dopaman_pos[1] - current_frame.get_height() // 2))
-        draw_fade(game_surface, retro_bg_color, fade_alpha)
-        screen.blit(game_surface, (0, 0))
-        pygame.display.flip()
-        fade_alpha = min(FADE_MAX, fade_alpha + fade_speed)
+    def draw_final_frame(surface):
+        scenery.draw(surface)
+        surface.blit(current_frame, (dopaman_pos[0] - current_frame.get_width() // 2, dopaman_pos[1] - current_frame.get_height() // 2))
+    yield from transition.frames(game_surface, draw_final_frame, lambda surface: present_frame(surface, screen, presenter), fade_in=False, duration=fade_duration(fade_speed))
 
 if __name__ == "__main__":
     import argparse
@@ -649,17 +561,7 @@ if __name__ == "__main__":
 
     # Try to load real Dopaman frames
     try:
-        dopaman_spritesheet = pygame.image.load(resource_path('images/dopaman.png')).convert_alpha()
-        frame_cols = 8
-        sheet_width, sheet_height = dopaman_spritesheet.get_size()
-        frame_width = sheet_width // frame_cols
-        frame_height = sheet_height
-        dopaman_frames = extract_frames(dopaman_spritesheet, frame_width, frame_height, frame_cols, row=0)
-        dopaman_scale_factor = 3
-        dopaman_frames = [pygame.transform.scale(
-            frame,
-            (int(frame_width * dopaman_scale_factor), int(frame_height * dopaman_scale_factor))
-        ) for frame in dopaman_frames]
+        dopaman_frames = load_dopaman_frames()
     except Exception as e:
         print("Warning: Could not load real Dopaman sprite, using dummy.")
         dopaman_frames = [dummy_img] * 8
@@ -686,13 +588,13 @@ if __name__ == "__main__":
 
     # Play the selected cutscene with real frames
     if args.cutscene == 1:
-        show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, 8, level=1)
+        run_cutscene(play_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, 8, level=1))
     elif args.cutscene == 2:
-        show_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, 8, level=2)
+        run_cutscene(play_cutscene(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, 8, level=2))
     elif args.cutscene == 3:
-        show_cutscene_3(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, 8)
+        run_cutscene(play_cutscene_3(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, 8))
     elif args.cutscene == 4:
-        show_cutscene_4(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, 8)
+        run_cutscene(play_cutscene_4(game_surface, screen, retro_small_font, retro_bg_color, dopaman_frames, 8))
     else:
         print("Invalid cutscene number. Use 1, 2, 3, or 4.")
 
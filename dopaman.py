@@ -1,12 +1,14 @@
 import pygame
 import os
 import sys
+from frame_bank import FRAME_BANK
 
 class Dopaman:
     def __init__(self, sprite_sheet_path, frame_rows, frame_cols, animation_speed=100):
-        # Load the sprite sheet
+        # Load the sprite sheet into the shared frame bank
+        self.sprite_sheet_path = self.resource_path(sprite_sheet_path)
         try:
-            self.sprite_sheet = pygame.image.load(self.resource_path(sprite_sheet_path)).convert_alpha()
+            self.sprite_sheet, _, _ = FRAME_BANK.load_sheet(self.sprite_sheet_path, frame_rows, frame_cols)
         except pygame.error as e:
             raise FileNotFoundError(f"Unable to load sprite sheet image at path: {sprite_sheet_path}\n{e}")
 
@@ -73,29 +75,29 @@ class Dopaman:
 
         self.actual_frame_col = start_col + self.current_frame
 
-    def get_frame(self, row, col):
-        x = col * self.frame_width
-        y = row * self.frame_height
-        return self.sprite_sheet.subsurface(pygame.Rect(x, y, self.frame_width, self.frame_height))
+    def get_frame(self, row, col, scale_factor=1, flip=False, tint=None):
+        return FRAME_BANK.frame(self.sprite_sheet_path, row, col, scale_factor, flip, tint)
 
-    def draw(self, screen, scale_factor=1):
+    def preload(self, scale_factor=1, tints=(None,)):
+        """Build every animation frame for this scale and these tints up front."""
+        for animation in self.animations.values():
+            for col in range(animation["start_col"], animation["start_col"] + animation["frames"]):
+                for flip in (False, True):
+                    for tint in tints:
+                        self.get_frame(animation["row"], col, scale_factor, flip, tint)
+
+    def blit_entry(self, scale_factor=1, tint=None):
+        """Return (frame, top-left) for the current frame centred on the position."""
         animation = self.animations[self.current_animation]
         animation_row = animation["row"]
 
-        frame = self.get_frame(animation_row, self.actual_frame_col)
-
-        if scale_factor != 1:
-            new_width = int(self.frame_width * scale_factor)
-            new_height = int(self.frame_height * scale_factor)
-            frame = pygame.transform.scale(frame, (new_width, new_height))
-        else:
-            new_width = self.frame_width
-            new_height = self.frame_height
+        # Scaled, flipped and tinted variants come pre-built from the frame bank
+        frame = self.get_frame(animation_row, self.actual_frame_col, scale_factor, self.flip, tint)
 
-        if self.flip:
-            frame = pygame.transform.flip(frame, True, False)
+        draw_x = self.position[0] - frame.get_width() // 2
+        draw_y = self.position[1] - frame.get_height() // 2
 
-        draw_x = self.position[0] - new_width // 2
-        draw_y = self.position[1] - new_height // 2
+        return (frame, (draw_x, draw_y))
 
-        screen.blit(frame, (draw_x, draw_y))
+    def draw(self, screen, scale_factor=1, tint=None):
+        return screen.blit(*self.blit_entry(scale_factor, tint))
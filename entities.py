@@ -38,10 +38,7 @@ class Enemy:
             self.rect = new_rect  # Update rect to match the new position
 
     def check_wall_collision(self, rect, walls):
-        for wall in walls:
-            if rect.colliderect(wall):
-                return True
-        return False
+        return rect.collidelist(walls) != -1
 
 class Star:
     def __init__(self, screen_width, screen_height):
@@ -0,0 +1,115 @@
+# fonts.py
+
+from collections import OrderedDict
+import pygame
+from utils import resource_path
+
+# Font faces used by the game
+ARIAL = "Arial"
+RETRO = "PressStart2P"
+
+# Faces that ship with the game; anything else is looked up with SysFont
+FONT_FILES = {
+    RETRO: "fonts/PressStart2P.ttf",
+}
+
+# Characters rasterized into every glyph atlas: printable ASCII
+ATLAS_CHARS = "".join(chr(code) for code in range(32, 127))
+
+class FontRegistry:
+    """Resolves each (face, size) once and hands out shared Font objects."""
+
+    def __init__(self):
+        self._fonts = {}
+        self._atlases = {}  # (face, size, color) -> GlyphAtlas
+
+    def get(self, face, size):
+        """Return the shared font for face at an absolute pixel size."""
+        size = max(1, int(size))
+        key = (face, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._load(face, size)
+            self._fonts[key] = font
+        return font
+
+    def atlas(self, face, size, color):
+        """Return the shared glyph atlas for a monospace face at an absolute size and colour."""
+        size = max(1, int(size))
+        key = (face, size, color)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(self.get(face, size), color)
+            self._atlases[key] = atlas
+        return atlas
+
+    def _load(self, face, size):
+        if face in FONT_FILES:
+            return pygame.font.Font(resource_path(FONT_FILES[face]), size)
+        return pygame.font.SysFont(face, size)
+
+class LabelCache:
+    """Pre-rendered text sprites keyed by (text, color)."""
+
+    def __init__(self, fonts, face, size):
+        self.fonts = fonts
+        self.face = face
+        self.size = size
+        self._labels = {}
+
+    def get(self, text, color):
+        key = (text, color)
+        label = self._labels.get(key)
+        if label is None:
+            font = self.fonts.get(self.face, self.size)
+            label = font.render(text, True, color).convert_alpha()
+            self._labels[key] = label
+        return label
+
+    def preload(self, entries):
+        """Render (text, color) pairs ahead of time."""
+        for text, color in entries:
+            self.get(text, color)
+
+class GlyphAtlas:
+    """A monospace font's printable glyphs rasterized once into one strip; text is a batch of sub-rect blits."""
+
+    def __init__(self, font, color, max_lines=32):
+        # One render of the whole set keeps every glyph on the same baseline a string render would use
+        self.surface = font.render(ATLAS_CHARS, True, color).convert_alpha()
+        self.advance = self.surface.get_width() // len(ATLAS_CHARS)
+        self.height = self.surface.get_height()
+        self._rects = {char: pygame.Rect(index * self.advance, 0, self.advance, self.height)
+                       for index, char in enumerate(ATLAS_CHARS) if char != " "}
+        self.max_lines = max_lines
+        self._lines = OrderedDict()  # text -> composed line, least recently used first
+
+    def size(self, text):
+        return (self.advance * len(text), self.height)
+
+    def get_rect(self, text, **kwargs):
+        """Rect text would cover, positioned like Surface.get_rect(center=...)."""
+        rect = pygame.Rect((0, 0), self.size(text))
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def render(self, text):
+        """Compose text from glyph sub-rects in one batched blit; recently drawn lines are kept."""
+        line = self._lines.get(text)
+        if line is not None:
+            self._lines.move_to_end(text)
+            return line
+        line = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        atlas, rects, advance = self.surface, self._rects, self.advance
+        # Copy glyph coverage as-is rather than blending it against the transparent line
+        line.blits([(atlas, (index * advance, 0), rects[char], pygame.BLEND_RGBA_MAX)
+                    for index, char in enumerate(text) if char in rects], doreturn=False)
+        self._lines[text] = line
+        if len(self._lines) > self.max_lines:
+            self._lines.popitem(last=False)
+        return line
+
+    def draw(self, surface, text, dest):
+        """Blit text with its top-left at dest (a point or rect); returns the covered rect."""
+        return surface.blit(self.render(text), dest)
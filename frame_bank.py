@@ -0,0 +1,53 @@
+# frame_bank.py
+
+import pygame
+from asset_formats import optimize_surface
+
+class FrameBank:
+    """Slices sprite-sheet frames once and caches every scaled or flipped variant."""
+
+    def __init__(self):
+        self._sheets = {}  # path -> (sheet surface, frame_width, frame_height)
+        self._grids = {}  # path -> (frame_rows, frame_cols) the sheet was sliced with
+        self._frames = {}  # (path, row, col, scale, flip, tint) -> frame surface
+
+    def load_sheet(self, path, frame_rows, frame_cols):
+        """Load a sprite sheet once; returns (sheet, frame_width, frame_height).
+
+        Frames are cached by path, so every caller has to slice a sheet with the same grid.
+        """
+        if path not in self._sheets:
+            sheet = pygame.image.load(path).convert_alpha()
+            sheet_width, sheet_height = sheet.get_size()
+            self._sheets[path] = (sheet, sheet_width // frame_cols, sheet_height // frame_rows)
+            self._grids[path] = (frame_rows, frame_cols)
+        elif self._grids[path] != (frame_rows, frame_cols):
+            raise ValueError(f"{path} is already loaded as {self._grids[path][0]}x{self._grids[path][1]} frames, "
+                             f"not {frame_rows}x{frame_cols}")
+        return self._sheets[path]
+
+    def frame(self, path, row, col, scale=1, flip=False, tint=None):
+        """Return the frame at (row, col) of a loaded sheet, scaled, flipped and RGBA-tinted as asked."""
+        key = (path, row, col, scale, flip, tint)
+        frame = self._frames.get(key)
+        if frame is None:
+            sheet, frame_width, frame_height = self._sheets[path]
+            frame = sheet.subsurface(pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height))
+            if scale != 1:
+                frame = pygame.transform.scale(frame, (int(frame_width * scale), int(frame_height * scale)))
+            if flip:
+                frame = pygame.transform.flip(frame, True, False)
+            if tint is not None:
+                frame = frame.convert_alpha()
+                frame.fill(tint, special_flags=pygame.BLEND_RGBA_MULT)
+            # Hard-edged frames become colorkeyed and RLE-encoded; soft ones keep their alpha
+            frame = optimize_surface(frame)
+            self._frames[key] = frame
+        return frame
+
+    def frames(self, path, row, cols, scale=1, flip=False, tint=None):
+        """Return a list of frames from one row of a loaded sheet."""
+        return [self.frame(path, row, col, scale, flip, tint) for col in cols]
+
+# Shared bank used by the player, the boss and the cutscenes
+FRAME_BANK = FrameBank()
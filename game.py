@@ -5,15 +5,27 @@ import sys
 import random
 import math  # Add this import
 from utils import *
-from entities import Enemy, Star
-from cutscenes import show_level_story
+from entities import Enemy
+from cutscenes import play_level_story
 from dopaman import Dopaman
 import utils
 from utils import scale_surface
 from mjf_helper import MJFHelper
+from fonts import FontRegistry, LabelCache, ARIAL, RETRO
+from hud import HUD
+from layers import StaticLayer
+from presenter import create_presenter, SOFTWARE
+from resolution import DynamicResolution, FRAME_BUDGET_MS
+from timestep import FixedTimestep, interpolate
+from asset_formats import load_image, optimize_surface
+from scenes import SceneStack, ScreenScene, GameplayScene, CutsceneScene
+from particles import ParticleSystem
+from starfield import Starfield
+from pages import PAGE_CACHE
+from render_queue import RenderQueue, ENEMY_LAYER, HELPER_LAYER, PLAYER_LAYER
 
 class Game:
-    def __init__(self):
+    def __init__(self, render_backend=SOFTWARE, render_fps=60):
         pygame.mixer.init()
         pygame.mixer.set_num_channels(8)
 
@@ -31,23 +43,55 @@ class Game:
             "shield": 1
         }
         self.window_size = (self.screen_width, self.screen_height)
-        self.screen = pygame.display.set_mode(self.window_size)
         pygame.display.set_caption("Dopaman")
         self.game_surface = pygame.Surface(self.window_size)
+        # Maps the game surface onto the window, by CPU scaling or through an SDL texture renderer
+        self.presenter = create_presenter(self.game_surface.get_size(), render_backend)
+        self.screen = self.presenter.set_mode(self.window_size)
+        self.frame_interval = 1000 / 60  # Milliseconds per frame at the game's 60 fps
+        self.menu_animation_interval = 1000 / 30  # Menu animations step at 30 fps
+        # Lowers the world render scale when frames overrun the display rate
+        self.resolution = DynamicResolution(budget_ms=1000 / render_fps if render_fps else FRAME_BUDGET_MS)
+        self.show_frame_stats = False  # F3 shows frame time and world scale in the window title
+        self.stats_timer = 0
+        self.world_layer = StaticLayer(self.draw_world_background)  # Background fill and walls
+        self.starfield = Starfield((self.screen_width, self.screen_height))  # Shared by the menus and, optionally, gameplay
+        self.starfield_background = False  # B scrolls the starfield behind the maze during gameplay
+        # World layer plus collectibles; set_starfield_background keys out its background colour
+        self.scene_layer = StaticLayer(self.draw_scene_background)
+        self.dirty_rect_mode = True  # Present only the regions that changed when the window allows it
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.render_queue = RenderQueue()  # Sprite blits for the frame, flushed in one batch
+        self.shield_sprite = self.build_shield_sprite(radius=25, width=2)  # Reduced from 40,3
+        self.max_particles = 4096  # Particle budget shared by all effects
+        self.particles = ParticleSystem(capacity=self.max_particles)
         self.clock = pygame.time.Clock()
-        self.running = True
+        self.scenes = SceneStack(self.clock, render_fps)  # One main loop paces menus, gameplay, cutscenes and pause
+        self.timestep = FixedTimestep()  # Gameplay steps at SIM_RATE whatever the display rate
+        self.previous_player_pos = None  # Positions before the last step, for interpolated drawing
+        self.previous_enemy_positions = {}
+        self.previous_helper_center = None
+        self.gameplay = GameplayScene(self)
         self.level = 1
         self.lives = 5
         self.score = 0
         self.high_score = self.load_high_score()
         self.dopaman = Dopaman(resource_path("images/dopaman.png"), frame_rows=1, frame_cols=8, animation_speed=100)
         self.dopaman_scale_factor = 1.2  # Increased from 0.7
+        # Death effect: the player fades out through red-tinted frames, one per interval
+        self.death_effect_frames = 10
+        self.death_effect_interval = 100
+        self.death_tints = [(255, 0, 0, 255 - i * (255 // self.death_effect_frames)) for i in range(self.death_effect_frames)]
+        self.damage_tint = self.death_tints[0]
+        self.dopaman.preload(self.dopaman_scale_factor, [None] + self.death_tints)
         self.dopamine_level = 100
         self.dopamine_depletion_rate = 0.05
         self.initial_player_speed = 5
         self.reduced_speed = 3
         self.player_speed = self.initial_player_speed
         self.player_pos = [self.screen_width // 2, self.screen_height // 2]
+        self.player_is_moving = False  # Set by apply_movement; a frame can be drawn before the first step
         self.difficulty_settings = {
             "Easy": {"depletion_rate": 0.04, "enemy_speed": 1.0},
             "Medium": {"depletion_rate": 0.05, "enemy_speed": 1.5},
@@ -65,11 +109,8 @@ class Game:
         self.display_info = pygame.display.Info()
         self.native_width = self.display_info.current_w
         self.native_height = self.display_info.current_h
-        self.scale_factor_x = 1
-        self.scale_factor_y = 1
         self.last_direction = 'right'
         self.game_paused = False
-        self.damage_animation_active = False
         self.damage_animation_timer = 0
         self.damage_animation_duration = 1000
         self.damage_flash_interval = 100
@@ -84,7 +125,6 @@ class Game:
         self.dbs_timer = 0
         self.shield_active = False
         self.shield_timer = 0
-        self.particles = []
         self.mjf_helper_speed = 2.0
         self.mjf_helper_pos = [random.randint(0, self.screen_width), random.randint(0, self.screen_height)]
         self.mjf_helper_radius = 100
@@ -149,10 +189,16 @@ class Game:
             ],
             # Add more levels as needed
         }
-        self.stars = [Star(self.screen_width, self.screen_height) for _ in range(100)]
-        self.uniform_scale = 1
         self.base_font_size = 24  # Increased from 16
         self.base_small_font_size = 20  # Increased from 12
+        self.fonts.get(ARIAL, self.base_font_size)  # Resolve the HUD font up front
+        self.init_hud()
+        self.labels.preload([
+            ("Dopamine", WHITE), ("Medicine", WHITE), ("Levodopa", WHITE), ("DBS", WHITE),
+            ("Stress Mgmt", WHITE), ("Mirapex", WHITE), ("Super Speed", WHITE), ("Shield", RED),
+            ("Depression", RED), ("Anxiety", RED), ("Fatigue", RED), ("Stress", RED),
+            ("Blocking!", YELLOW)
+        ])
         self.base_radius = 15  # Decreased from 20 to make collectibles smaller
         self.base_label_offset = 15  # Adjusted from 10
         self.safe_spawn_radius = 200  # Minimum safe distance for respawning
@@ -160,17 +206,19 @@ class Game:
     def load_assets(self):
         # Load images, sounds, fonts
         try:
-            dopaman_image = pygame.image.load(resource_path('images/dopaman.png')).convert_alpha()
+            dopaman_image = pygame.image.load(resource_path('images/dopaman.png'))
             scale_factor = 2  # Adjust this factor as needed
             new_width = int(dopaman_image.get_width() * scale_factor)
             new_height = int(dopaman_image.get_height() * scale_factor)
-            self.dopaman_image = pygame.transform.scale(dopaman_image, (new_width, new_height))
-            self.mjf_helper_image = pygame.image.load(resource_path("images/mjf.jpeg")).convert_alpha()
-            self.enemy_image = pygame.image.load(resource_path("images/enemy.png")).convert_alpha()
+            self.dopaman_image = optimize_surface(pygame.transform.scale(dopaman_image, (new_width, new_height)))
+            self.mjf_helper_image = load_image(resource_path("images/mjf.jpeg"))
+            self.enemy_image = load_image(resource_path("images/enemy.png"))
             # Load fonts
-            self.retro_font = pygame.font.Font(resource_path("fonts/PressStart2P.ttf"), 32)
-            self.retro_small_font = pygame.font.Font(resource_path("fonts/PressStart2P.ttf"), 16)
-            self.game_font = pygame.font.SysFont("Arial", 28)
+            self.fonts = FontRegistry()
+            self.retro_font = self.fonts.get(RETRO, 32)
+            self.retro_small_font = self.fonts.get(RETRO, 16)
+            self.game_font = self.fonts.get(ARIAL, 28)
+            self.labels = LabelCache(self.fonts, ARIAL, 28)
             # Load sounds
             self.collect_sound = utils.pygame.mixer.Sound(resource_path("sounds/collect_sound.mp3"))
             self.game_over_sound = utils.pygame.mixer.Sound(resource_path("sounds/game_over.mp3"))
@@ -218,7 +266,9 @@ class Game:
         self.dbs_timer = 0
         self.shield_active = False
         self.shield_timer = 0
-        self.particles = []
+        self.particles.clear()
+        self.death_effect_timer = None  # Ticks when the current death effect started
+        self.damage_animation_active = False
         self.mjf_helper_pos = [random.randint(0, self.screen_width), random.randint(0, self.screen_height)]
 
     def generate_walls(self):
@@ -289,6 +339,10 @@ class Game:
             if not wall.colliderect(player_safe_zone):
                 self.walls.append(wall)
 
+        # Re-bake the static world layer with the new walls
+        self.world_layer.invalidate()
+        self.scene_layer.invalidate()
+
     def generate_procedural_layout(self):
         """Generate procedural wall layouts for higher levels"""
         layout = []
@@ -318,11 +372,7 @@ class Game:
 
     def check_wall_collision(self, rect):
         """Check if the given rectangle collides with any walls."""
-        for wall in self.walls:
-            if rect.colliderect(wall):
-                print(f"Collision with wall: {wall}")  # Debugging output
-                return True
-        return False
+        return rect.collidelist(self.walls) != -1
 
     def generate_collectibles(self):
         """Generate collectibles with proper collision checking."""
@@ -339,11 +389,7 @@ class Game:
                                              collectible_radius * 2, collectible_radius * 2)
 
                 # Check if it collides with walls
-                wall_collision = False
-                for wall in self.walls:
-                    if wall.colliderect(collectible_rect):
-                        wall_collision = True
-                        break
+                wall_collision = collectible_rect.collidelist(self.walls) != -1
 
                 # Check other collectibles to prevent overlap
                 too_close_to_others = False
@@ -380,30 +426,43 @@ class Game:
             if attempt >= max_attempts:
                 print(f"Warning: Could not place all {collectible_type} collectibles after {max_attempts} attempts")
 
+        self.scene_layer.invalidate()
+
     def run(self):
-        # Main game loop
-        self.start_screen()
-        self.start_game()
-
-    def handle_events(self):
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_p:
-                    self.pause()
-                if event.key == pygame.K_f:  # Changed from K_f to K_F11
-                    self.toggle_fullscreen()
-                if event.key == pygame.K_ESCAPE and self.is_fullscreen:  # Add ESC key to exit fullscreen
-                    self.toggle_fullscreen()
-                if event.key == pygame.K_RETURN:
-                    if self.game_paused:
-                        self.game_paused = False
+        # Main game loop: the prologue plays over the start screen, which leads on to gameplay
+        self.scenes.push(self.start_screen())
+        self.scenes.push(self.show_prologue())
+        self.scenes.run()
+
+    def handle_event(self, event):
+        # Handle gameplay input; quitting is handled by the scene stack
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_p:
+                self.scenes.push(self.pause())
+            if event.key == pygame.K_f:  # Changed from K_f to K_F11
+                self.toggle_fullscreen()
+            if event.key == pygame.K_ESCAPE and self.is_fullscreen:  # Add ESC key to exit fullscreen
+                self.toggle_fullscreen()
+            if event.key == pygame.K_b:
+                self.set_starfield_background(not self.starfield_background)
+            if event.key == pygame.K_F3:
+                self.show_frame_stats = not self.show_frame_stats
+                if not self.show_frame_stats:
+                    self.presenter.set_caption("Dopaman")
+            if event.key == pygame.K_RETURN:
+                if self.game_paused:
+                    self.game_paused = False
 
     def update(self):
+        """Advance the game by one fixed simulation step."""
+        # Particles and the starfield keep moving while the death effect plays
+        self.particles.update()
+        if self.starfield_background:
+            self.starfield.update()
+        # Gameplay is frozen while the death effect plays; events and drawing carry on
+        if self.death_effect_timer is not None:
+            self.update_death_effect()
+            return
         # Update game state
         self.dopaman.update()
         self.apply_movement()
@@ -411,9 +470,12 @@ class Game:
         self.move_mjf_helper()
         self.check_collectible_collision()
         self.apply_enemy_effects()
-        self.check_game_over()
         if self.dopamine_level <= 0:
-            self.game_over()
+            self.scenes.push(self.game_over())
+            return
+        self.check_game_over()
+        if self.death_effect_timer is not None:
+            return
         # Deplete dopamine
         self.dopamine_level -= self.dopamine_depletion_rate
         # Handle power-up timers
@@ -423,6 +485,8 @@ class Game:
             self.shield_active = False
         if self.confused_active and pygame.time.get_ticks() - self.confused_timer > 5000:
             self.confused_active = False
+        if self.damage_animation_active and pygame.time.get_ticks() - self.damage_animation_timer > self.damage_animation_duration:
+            self.damage_animation_active = False
         # Check if level is complete
         if self.check_level_complete():
             self.level += 1
@@ -435,51 +499,63 @@ class Game:
 
     # game.py
 
-    def draw(self):
-        """Draw all game elements directly on the screen."""
-        # Clear the game surface
-        self.game_surface.fill(RETRO_BG_COLOR)
-
-        # Draw walls directly on the game surface
-        self.draw_walls()
-
-        # Draw enemies directly on the game surface
-        self.draw_enemies()
-
-        # Draw Michael J. Fox helper directly on the game surface
-        self.draw_mjf_helper()
-
-        # Draw collectibles directly on the game surface
-        self.draw_collectibles()
-
-        # Draw player (Dopaman) directly on the game surface
-        self.draw_player()
-
-        # Update particles directly on the game surface
-        self.update_particles()
+    def store_positions(self):
+        """Remember where the moving sprites are before a simulation step."""
+        self.previous_player_pos = tuple(self.player_pos)
+        self.previous_enemy_positions = {enemy: tuple(enemy.pos) for enemy in self.enemies}
+        self.previous_helper_center = self.mjf_helper.rect.center if hasattr(self, 'mjf_helper') else None
 
-        # Draw power-up status directly on the game surface
-        self.draw_power_up_status()
+    def draw(self, alpha=1.0):
+        """Draw all game elements and present them to the screen.
 
-        # Draw dopamine bar directly on the game surface
-        self.draw_dopamine_bar()
-
-        # Draw lives directly on the game surface
-        self.draw_lives()
-
-        # Draw level directly on the game surface
-        self.draw_level()
-
-        # Draw score directly on the game surface
-        self.draw_score()
-
-        # Draw high score directly on the game surface
-        self.draw_high_score()
+        Moving sprites are drawn alpha of the way from their positions before the last
+        simulation step to their current ones.
+        """
+        # Dirty-rect mode needs a window the presenter can update region by region
+        dirty_mode = self.dirty_rect_mode and self.presenter.supports_regions and not self.starfield_background
+        full_redraw = not dirty_mode or self.full_redraw or self.scene_layer.is_stale(self.game_surface.get_size())
 
-        # Scale the game surface to match the screen size and update the display
-        scaled_surface = pygame.transform.scale(self.game_surface, self.window_size)
-        self.screen.blit(scaled_surface, (0, 0))
-        pygame.display.flip()
+        if full_redraw:
+            # Start from the pre-baked background, walls and collectibles
+            self.draw_scene(self.game_surface)
+        else:
+            # Restore only the areas dynamic sprites covered last frame
+            self.scene_layer.restore(self.game_surface, self.dirty_rects)
+
+        # Queue the dynamic sprites, then blit them in one batch, keeping the rects they cover
+        self.draw_enemies(alpha)
+        self.draw_mjf_helper(alpha)
+        self.draw_player(alpha)
+        sprite_rects = self.render_queue.flush(self.game_surface, doreturn=dirty_mode)
+        sprite_rects += self.particles.draw(self.game_surface, alpha)
+
+        # Draw the HUD (power-ups, dopamine, lives, level, scores) from its cache
+        hud_rects = self.hud.update()
+
+        if not dirty_mode:
+            self.hud.draw(self.game_surface)
+            self.presenter.present(self.game_surface, crisp_rects=self.hud.regions())
+        elif full_redraw:
+            # Compose the final frame away from the game surface so it never holds HUD pixels
+            frame = self.presenter.frame_surface()
+            frame.blit(self.game_surface, (0, 0))
+            self.hud.draw(frame)
+            self.presenter.present(frame)
+        else:
+            frame = self.presenter.frame_surface()
+            frame_rect = frame.get_rect()
+            update_rects = [rect.clip(frame_rect) for rect in self.dirty_rects + sprite_rects + hud_rects]
+            update_rects = [rect for rect in update_rects if rect.width and rect.height]
+            # Copy each region and re-apply the HUD inside it, so overlapping regions never blend the HUD twice
+            sequence = []
+            for rect in update_rects:
+                sequence.append((self.game_surface, rect, rect))
+                sequence += self.hud.blit_sequence(rect)
+            frame.blits(sequence, doreturn=False)
+            self.presenter.present(frame, update_rects)
+
+        self.dirty_rects = sprite_rects
+        self.full_redraw = False
 
     def apply_movement(self):
         keys = pygame.key.get_pressed()
@@ -518,15 +594,9 @@ class Game:
             # Update player position only if no collision
             if 0 <= new_rect.left and new_rect.right <= self.screen_width:  # Horizontal boundaries
                 self.player_pos[0] = new_x
-            else:
-                print("Horizontal boundary collision")
 
             if 0 <= new_rect.top and new_rect.bottom <= self.screen_height:  # Vertical boundaries
                 self.player_pos[1] = new_y
-            else:
-                print("Vertical boundary collision")
-        else:
-            print("Collision detected with wall.")
 
         # Apply tremor effect if dopamine level is low and DBS is inactive
         if not self.dbs_active:
@@ -539,28 +609,23 @@ class Game:
         # Implement pause screen
         self.game_paused = True
         pygame.mixer.music.pause()
-        while self.game_paused:
-            self.game_surface.fill(RETRO_BG_COLOR)
-            pause_text = self.retro_font.render("PAUSED", True, YELLOW)
-            pause_rect = pause_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            self.game_surface.blit(pause_text, pause_rect)
-            instruction_text = self.retro_small_font.render("Press 'P' to Resume", True, WHITE)
-            instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 50))
-            self.game_surface.blit(instruction_text, instruction_rect)
-            scaled_surface = pygame.transform.scale(self.game_surface, self.screen.get_size())
-            self.screen.blit(scaled_surface, (0, 0))
-            pygame.display.flip()
-            self.clock.tick(60)
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_p:
-                        pygame.mixer.music.unpause()
-                        self.game_paused = False
-                    if event.key == pygame.K_f:
-                        self.toggle_fullscreen()
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+
+        def draw(surface):
+            surface.fill(RETRO_BG_COLOR)
+            self.draw_retro_text(surface, "PAUSED", 32, YELLOW, center=(self.screen_width // 2, self.screen_height // 2))
+            self.draw_retro_text(surface, "Press 'P' to Resume", 16, WHITE, center=(self.screen_width // 2, self.screen_height // 2 + 50))
+
+        def handle_key(event):
+            if event.key == pygame.K_p:
+                pygame.mixer.music.unpause()
+                self.game_paused = False
+                self.scenes.pop()
+            elif event.key == pygame.K_f:
+                self.toggle_fullscreen()
+
+        # Nothing moves while paused, so the screen sleeps until a key arrives
+        return ScreenScene(self, draw, handle_key)
+
     def apply_enemy_effects(self):
         """
         Apply the effects of any enemies that collide with the player.
@@ -577,9 +642,9 @@ class Game:
                     if enemy.name == "Depression":
                         # Reduce dopamine level due to collision with "Depression"
                         self.dopamine_level -= self.dopamine_depletion_rate
+                        self.start_damage_effect()
                         if self.dopamine_level <= 0:
-                            # If dopamine level hits zero, game over
-                            self.game_over()
+                            # If dopamine level hits zero, update ends the game
                             return
                     elif enemy.name == "Anxiety":
                         # Slow down the player due to "Anxiety" enemy
@@ -587,6 +652,7 @@ class Game:
                     elif enemy.name == "Fatigue":
                         # Reduce dopamine level due to "Fatigue"
                         self.dopamine_level -= 0.5
+                        self.start_damage_effect()
                     elif enemy.name == "Stress":
                         # Set confused effect to True due to "Stress"
                         self.confused_active = True
@@ -601,21 +667,21 @@ class Game:
         
         if self.is_fullscreen:
             # Save the current window size before going fullscreen
-            self.windowed_size = self.screen.get_size()
+            self.windowed_size = self.presenter.window_size
             # Set to native resolution for fullscreen
-            self.screen = pygame.display.set_mode((self.native_width, self.native_height), pygame.FULLSCREEN)
+            self.screen = self.presenter.set_mode((self.native_width, self.native_height), pygame.FULLSCREEN, RETRO_BG_COLOR)
         else:
             # Return to windowed mode with previous size
-            self.screen = pygame.display.set_mode(self.window_size)
+            self.screen = self.presenter.set_mode(self.windowed_size, bg_color=RETRO_BG_COLOR)
 
-        # Update scaling factors
-        current_size = self.screen.get_size()
-        self.scale_factor_x = current_size[0] / self.screen_width
-        self.scale_factor_y = current_size[1] / self.screen_height
-        self.uniform_scale = min(self.scale_factor_x, self.scale_factor_y)
+        # The presenter has mapped the logical game surface onto the new window
+        self.full_redraw = True
+        # Frame costs change with the window size, so measure again from full scale
+        self.resolution.reset()
+        self.presenter.set_render_scale(self.resolution.scale)
 
         # Update the window size
-        self.window_size = current_size
+        self.window_size = self.presenter.window_size
 
     def move_enemies(self):
         for enemy in self.enemies:
@@ -636,6 +702,7 @@ class Game:
             if player_rect.collidepoint(collectible):
                 # Remove the collected item from the list of collectibles
                 self.dopamine_collectibles.remove(collectible)
+                self.scene_layer.invalidate()
                 
                 # Increase dopamine level and update score
                 self.dopamine_level = min(100, self.dopamine_level + 20)
@@ -653,6 +720,7 @@ class Game:
         for medicine in self.medicine_collectibles[:]:
             if player_rect.collidepoint(medicine):
                 self.medicine_collectibles.remove(medicine)
+                self.scene_layer.invalidate()
                 
                 # Increase dopamine level and disable tremor
                 self.dopamine_level = min(100, self.dopamine_level + 30)
@@ -671,6 +739,7 @@ class Game:
         for levodopa in self.levodopa_collectibles[:]:
             if player_rect.collidepoint(levodopa):
                 self.levodopa_collectibles.remove(levodopa)
+                self.scene_layer.invalidate()
 
                 # Apply levodopa effects
                 self.levodopa_effect()
@@ -687,6 +756,7 @@ class Game:
         for dbs in self.dbs_collectibles[:]:
             if player_rect.collidepoint(dbs):
                 self.dbs_collectibles.remove(dbs)
+                self.scene_layer.invalidate()
 
                 # Apply DBS effect
                 self.dbs_effect()
@@ -703,6 +773,7 @@ class Game:
         for stress in self.stress_management_collectibles[:]:
             if player_rect.collidepoint(stress):
                 self.stress_management_collectibles.remove(stress)
+                self.scene_layer.invalidate()
 
                 # Apply stress management effect
                 self.stress_management_effect()
@@ -719,6 +790,7 @@ class Game:
         for mirapex in self.mirapex_collectibles[:]:
             if player_rect.collidepoint(mirapex):
                 self.mirapex_collectibles.remove(mirapex)
+                self.scene_layer.invalidate()
 
                 # Apply mirapex effect
                 self.mirapex_effect()
@@ -735,6 +807,7 @@ class Game:
         for speed in self.super_speed_collectibles[:]:
             if player_rect.collidepoint(speed):
                 self.super_speed_collectibles.remove(speed)
+                self.scene_layer.invalidate()
 
                 # Apply super speed effect
                 self.super_speed_effect()
@@ -751,6 +824,7 @@ class Game:
         for shield in self.shield_collectibles[:]:
             if player_rect.collidepoint(shield):
                 self.shield_collectibles.remove(shield)
+                self.scene_layer.invalidate()
 
                 # Apply shield effect
                 self.shield_effect()
@@ -765,7 +839,6 @@ class Game:
 
     def check_game_over(self):
         player_rect = pygame.Rect(self.player_pos[0] - 20, self.player_pos[1] - 30, 40, 60)
-        collision_occurred = False
 
         for enemy in self.enemies:
             enemy_rect = enemy.rect
@@ -773,29 +846,35 @@ class Game:
                 if not self.shield_active:
                     self.lives -= 1
                     self.create_particles(self.player_pos, RED)
-                    collision_occurred = True
-                    self.play_death_animation()
-
-                    if self.lives <= 0:
-                        self.game_over()
-                    else:
-                        # Reset player position and state
-                        self.player_pos[0], self.player_pos[1] = self.screen_width // 2, self.screen_height // 2
-                        self.tremor_active = False
-                        self.confused_active = False
-                        self.shield_active = False
-
-                        # Create safe zone before respawning
-                        self.ensure_safe_spawn()
-
-        if collision_occurred and self.lives <= 0:
-            # Save high score
-            if self.score > self.high_score:
-                self.high_score = self.score
-                self.save_high_score()
-
-            # End game
-            self.running = False
+                    # Respawn or game over happens once the effect has played out
+                    self.start_death_effect()
+                    return
+
+    def start_death_effect(self):
+        self.death_effect_timer = pygame.time.get_ticks()
+        self.damage_animation_active = False
+
+    def update_death_effect(self):
+        """Finish the death effect once its last frame has shown, then respawn or end the game."""
+        if pygame.time.get_ticks() - self.death_effect_timer < self.death_effect_frames * self.death_effect_interval:
+            return
+        self.death_effect_timer = None
+
+        if self.lives <= 0:
+            self.scenes.push(self.game_over())
+        else:
+            # Reset player position and state
+            self.player_pos[0], self.player_pos[1] = self.screen_width // 2, self.screen_height // 2
+            self.tremor_active = False
+            self.confused_active = False
+            self.shield_active = False
+
+            # Create safe zone before respawning
+            self.ensure_safe_spawn()
+
+    def start_damage_effect(self):
+        self.damage_animation_active = True
+        self.damage_animation_timer = pygame.time.get_ticks()
 
     def ensure_safe_spawn(self):
         """Create a safe zone for player respawn by moving enemies away."""
@@ -836,8 +915,8 @@ class Game:
                 len(self.shield_collectibles) == 0)
 
     def next_level(self):
-    # Display the story for the new level
-        show_level_story(
+    # Play the story for the new level over the gameplay scene
+        self.scenes.push(CutsceneScene(self, play_level_story(
         game_surface=self.game_surface,
         screen=self.screen,
         level=self.level,
@@ -847,8 +926,9 @@ class Game:
         retro_bg_color=RETRO_BG_COLOR,
         player_image=self.dopaman_image,
         mjf_helper_image=self.mjf_helper_image,
-        enemy_image=self.enemy_image
-        )
+        enemy_image=self.enemy_image,
+        presenter=self.presenter
+        )))
 
         # Adjust game variables based on the new level
         self.enemy_speed *= 1.05
@@ -871,6 +951,7 @@ class Game:
 
         # Create enemies for the new level
         self.create_enemies()
+        self.full_redraw = True
 
     def game_over(self):
         pygame.mixer.music.stop()
@@ -878,42 +959,34 @@ class Game:
         if self.sounds.get('game_over'):
             self.sounds['game_over'].play()
 
-        clock = pygame.time.Clock()
-        game_over_displayed = True
-        while game_over_displayed:
-            self.game_surface.fill(RETRO_BG_COLOR)
-            game_over_text = self.retro_font.render("GAME OVER", True, RED)
-            game_over_rect = game_over_text.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
-            self.game_surface.blit(game_over_text, game_over_rect)
+        # Save high score
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self.save_high_score()
+
+        def draw(surface):
+            surface.fill(RETRO_BG_COLOR)
+            self.draw_retro_text(surface, "GAME OVER", 32, RED, center=(self.screen_width // 2, self.screen_height // 3))
 
             score_text = self.game_font.render(f"Score: {self.score}", True, WHITE)
             score_rect = score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            self.game_surface.blit(score_text, score_rect)
+            surface.blit(score_text, score_rect)
 
             high_score_text = self.game_font.render(f"High Score: {self.high_score}", True, WHITE)
             high_score_rect = high_score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 50))
-            self.game_surface.blit(high_score_text, high_score_rect)
-
-            instruction_text = self.retro_small_font.render("Press Enter to Restart or Esc to Quit", True, WHITE)
-            instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height - 100))
-            self.game_surface.blit(instruction_text, instruction_rect)
-
-            scaled_surface = pygame.transform.scale(self.game_surface, self.screen.get_size())
-            self.screen.blit(scaled_surface, (0, 0))
-            pygame.display.flip()
-            clock.tick(60)
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        game_over_displayed = False
-                        self.restart_game()
-                        self.running = True  # Set running to True to restart the game
-                    elif event.key == pygame.K_ESCAPE:
-                        game_over_displayed = False
-                        self.running = False  # Set running to False to exit
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+            surface.blit(high_score_text, high_score_rect)
+
+            self.draw_retro_text(surface, "Press Enter to Restart or Esc to Quit", 16, WHITE, center=(self.screen_width // 2, self.screen_height - 100))
+
+        def handle_key(event):
+            if event.key == pygame.K_RETURN:
+                # Back to the same gameplay scene, so restarts never nest
+                self.restart_game()
+                self.scenes.pop()
+            elif event.key == pygame.K_ESCAPE:
+                self.scenes.clear()  # Ends the main loop
+
+        return ScreenScene(self, draw, handle_key)
 
     def restart_game(self):
         pygame.mixer.music.play(-1)  # Restart music when game restarts
@@ -927,71 +1000,55 @@ class Game:
         self.generate_walls()
         self.create_enemies()
         self.generate_collectibles()
-        self.running = True  # Set running to True to restart the game loop
+        self.full_redraw = True
+
+    def draw_retro_text(self, surface, text, size, color, **position):
+        """Draw PressStart2P text onto surface from its glyph atlas, placed like get_rect(center=...)."""
+        atlas = self.fonts.atlas(RETRO, size, color)
+        return atlas.draw(surface, text, atlas.get_rect(text, **position))
 
     def start_screen(self):
-        self.show_prologue()
-        clock = pygame.time.Clock()
         blink = True
         blink_timer = 0
 
-        # Create stars specifically for the start screen
-        stars = [Star(self.screen_width, self.screen_height) for _ in range(100)]
-
-        while True:
+        def draw(surface):
             # Fill background with the retro color
-            self.game_surface.fill(RETRO_BG_COLOR)
+            surface.fill(RETRO_BG_COLOR)
 
             # Draw moving stars
-            for star in stars:
-                star.move()
-                pygame.draw.circle(self.game_surface, WHITE, (int(star.x), int(star.y)), star.size)
+            self.starfield.draw(surface)
 
             # Render the title text
-            title_text = self.retro_font.render("DOPAMAN", True, GREEN)
-            title_rect = title_text.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
-            self.game_surface.blit(title_text, title_rect)
+            self.draw_retro_text(surface, "DOPAMAN", 32, GREEN, center=(self.screen_width // 2, self.screen_height // 3))
 
             # Render blinking instruction text
             if blink:
-                instruction_text = self.retro_small_font.render("Press Enter to Start", True, WHITE)
-                instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-                self.game_surface.blit(instruction_text, instruction_rect)
+                self.draw_retro_text(surface, "Press Enter to Start", 16, WHITE, center=(self.screen_width // 2, self.screen_height // 2))
 
             # Render high score
-            high_score_text = self.retro_small_font.render(f'HIGH SCORE: {self.high_score}', True, WHITE)
-            high_score_rect = high_score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 50))
-            self.game_surface.blit(high_score_text, high_score_rect)
+            self.draw_retro_text(surface, f'HIGH SCORE: {self.high_score}', 16, WHITE, center=(self.screen_width // 2, self.screen_height // 2 + 50))
+
+        def tick(elapsed):
+            nonlocal blink, blink_timer
+            # Stars keep their per-frame speed whatever the tick rate
+            self.starfield.update(elapsed / self.frame_interval)
 
             # Toggle blinking effect
-            blink_timer += clock.get_time()
+            blink_timer += elapsed
             if blink_timer >= 500:
                 blink = not blink
                 blink_timer = 0
+            return True
 
-            # Render the scaled game surface
-            scaled_surface = pygame.transform.scale(self.game_surface, self.screen.get_size())
-            self.screen.blit(scaled_surface, (0, 0))
-            pygame.display.flip()
-            clock.tick(60)
-
-            # Handle input events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        self.difficulty_selection()
-                        self.tutorial_screen()
-                        return  # Exit the start screen
-                    if event.key == pygame.K_f:
-                        self.toggle_fullscreen()
+        def handle_key(event):
+            if event.key == pygame.K_RETURN:
+                self.scenes.replace(self.difficulty_selection())
+            elif event.key == pygame.K_f:
+                self.toggle_fullscreen()
 
+        return ScreenScene(self, draw, handle_key, tick, self.menu_animation_interval)
 
     def show_prologue(self):
-        clock = pygame.time.Clock()
-        showing_prologue = True
         story_text = [
             "In the depths of the human brain,",
             "a heroic neurotransmitter named Dopaman",
@@ -1016,55 +1073,33 @@ class Game:
 
         fade_alpha = 0
         fade_speed = 2
-        text_surfaces = []
-        text_positions = []
 
-        # Pre-render text
-        y_offset = 100 * self.scale_factor_y
-        for line in story_text:
-            text_surface = self.retro_small_font.render(line, True, WHITE)
-            text_rect = text_surface.get_rect(center=(self.screen_width // 2, y_offset))
-            text_surfaces.append(text_surface)
-            text_positions.append(text_rect)
-            y_offset += 30 * self.scale_factor_y
+        # The whole prologue is one cached page, faded in with a single alpha blit
+        page = PAGE_CACHE.centered("prologue", story_text, self.retro_small_font, WHITE, RETRO_BG_COLOR,
+                                   self.game_surface.get_size(), top=100, line_step=30)
 
-        while showing_prologue:
-            self.game_surface.fill(RETRO_BG_COLOR)
+        def draw(surface):
+            surface.fill(RETRO_BG_COLOR)
 
             # Draw text with fade effect
-            for surface, pos in zip(text_surfaces, text_positions):
-                temp_surface = surface.copy()
-                temp_surface.set_alpha(fade_alpha)
-                self.game_surface.blit(temp_surface, pos)
-
-            # Fade in
-            if fade_alpha < 255:
-                fade_alpha = min(255, fade_alpha + fade_speed)
-
-            scaled_surface = pygame.transform.scale(self.game_surface, self.window_size)
-            self.screen.blit(scaled_surface, (0, 0))
-            pygame.display.flip()
-            clock.tick(60)
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        showing_prologue = False
-                    if event.key == pygame.K_f:
-                        self.toggle_fullscreen()
-
-    def get_scaled_text_positions(self, total_height, line_spacing):
-        """Helper method to calculate scaled text positions"""
-        available_height = self.screen.get_height()
-        start_y = (available_height - total_height) // 2
-        return start_y, line_spacing * self.scale_factor_y
+            page.set_alpha(int(fade_alpha))
+            surface.blit(page, (0, 0))
+
+        def tick(elapsed):
+            nonlocal fade_alpha
+            # Fade in, then leave the finished page up until a key arrives
+            fade_alpha = min(255, fade_alpha + fade_speed * elapsed / self.frame_interval)
+            return fade_alpha < 255
+
+        def handle_key(event):
+            if event.key == pygame.K_f:
+                self.toggle_fullscreen()
+            elif event.key == pygame.K_RETURN:
+                self.scenes.pop()
+
+        return ScreenScene(self, draw, handle_key, tick, self.frame_interval)
 
     def difficulty_selection(self):
-        clock = pygame.time.Clock()
-        selecting = True
         difficulties = ["Easy", "Medium", "Hard"]
         selected_index = 1
 
@@ -1072,21 +1107,15 @@ class Game:
         title_size = min(32, int(self.screen_height * 0.05))  # 5% of screen height
         option_size = min(16, int(self.screen_height * 0.025))  # 2.5% of screen height
 
-        # Create appropriately sized fonts
-        title_font = pygame.font.Font(resource_path("fonts/PressStart2P.ttf"), title_size)
-        option_font = pygame.font.Font(resource_path("fonts/PressStart2P.ttf"), option_size)
-
-        while selecting:
-            self.game_surface.fill(RETRO_BG_COLOR)
+        def draw(surface):
+            surface.fill(RETRO_BG_COLOR)
             
             screen_center_x = self.screen_width // 2
             screen_height = self.screen_height
             
             # Title position - 20% from the top
             title_y = int(screen_height * 0.2)
-            title_text = title_font.render("SELECT DIFFICULTY", True, GREEN)
-            title_rect = title_text.get_rect(center=(screen_center_x, title_y))
-            self.game_surface.blit(title_text, title_rect)
+            self.draw_retro_text(surface, "SELECT DIFFICULTY", title_size, GREEN, center=(screen_center_x, title_y))
 
             # Calculate positions for difficulty options
             spacing = int(screen_height * 0.1)  # 10% of screen height
@@ -1095,44 +1124,30 @@ class Game:
             for i, diff in enumerate(difficulties):
                 y_pos = start_y + i * spacing
                 if i == selected_index:
-                    diff_text = option_font.render(f"> {diff} <", True, YELLOW)
+                    self.draw_retro_text(surface, f"> {diff} <", option_size, YELLOW, center=(screen_center_x, y_pos))
                 else:
-                    diff_text = option_font.render(diff, True, WHITE)
-                diff_rect = diff_text.get_rect(center=(screen_center_x, y_pos))
-                self.game_surface.blit(diff_text, diff_rect)
+                    self.draw_retro_text(surface, diff, option_size, WHITE, center=(screen_center_x, y_pos))
 
             # Instructions at the bottom
-            instruction_text = option_font.render("Use UP/DOWN arrows and ENTER to select", True, WHITE)
-            instruction_rect = instruction_text.get_rect(center=(screen_center_x, screen_height * 0.8))
-            self.game_surface.blit(instruction_text, instruction_rect)
-
-            # Scale and display
-            scaled_surface = pygame.transform.scale(self.game_surface, self.window_size)
-            self.screen.blit(scaled_surface, (0, 0))
-            pygame.display.flip()
-            clock.tick(60)
-
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        selected_index = (selected_index - 1) % len(difficulties)
-                    elif event.key == pygame.K_DOWN:
-                        selected_index = (selected_index + 1) % len(difficulties)
-                    elif event.key == pygame.K_RETURN:
-                        self.selected_difficulty = difficulties[selected_index]
-                        self.enemy_speed = self.difficulty_settings[self.selected_difficulty]["enemy_speed"]
-                        self.dopamine_depletion_rate = self.difficulty_settings[self.selected_difficulty]["depletion_rate"]
-                        selecting = False
-                    elif event.key == pygame.K_f:
-                        self.toggle_fullscreen()
+            self.draw_retro_text(surface, "Use UP/DOWN arrows and ENTER to select", option_size, WHITE, center=(screen_center_x, screen_height * 0.8))
+
+        def handle_key(event):
+            nonlocal selected_index
+            if event.key == pygame.K_UP:
+                selected_index = (selected_index - 1) % len(difficulties)
+            elif event.key == pygame.K_DOWN:
+                selected_index = (selected_index + 1) % len(difficulties)
+            elif event.key == pygame.K_RETURN:
+                self.selected_difficulty = difficulties[selected_index]
+                self.enemy_speed = self.difficulty_settings[self.selected_difficulty]["enemy_speed"]
+                self.dopamine_depletion_rate = self.difficulty_settings[self.selected_difficulty]["depletion_rate"]
+                self.scenes.replace(self.tutorial_screen())
+            elif event.key == pygame.K_f:
+                self.toggle_fullscreen()
+
+        return ScreenScene(self, draw, handle_key)
 
     def tutorial_screen(self):
-        clock = pygame.time.Clock()
-        showing_tutorial = True
         tutorial_text = [
             "HOW TO PLAY",
             "",
@@ -1142,6 +1157,7 @@ class Game:
             "Use power-ups to gain advantages.",
             "Press 'P' to pause the game.",
             "Press F to toggle fullscreen",
+            "Press B to toggle the starfield",
             "",
             "Press Enter to continue..."
         ]
@@ -1150,12 +1166,8 @@ class Game:
         title_size = min(32, int(self.screen_height * 0.05))  # 5% of screen height
         text_size = min(16, int(self.screen_height * 0.025))  # 2.5% of screen height
 
-        # Create appropriately sized fonts
-        title_font = pygame.font.Font(resource_path("fonts/PressStart2P.ttf"), title_size)
-        text_font = pygame.font.Font(resource_path("fonts/PressStart2P.ttf"), text_size)
-
-        while showing_tutorial:
-            self.game_surface.fill(RETRO_BG_COLOR)
+        def draw(surface):
+            surface.fill(RETRO_BG_COLOR)
             
             screen_center_x = self.screen_width // 2
             screen_height = self.screen_height
@@ -1169,140 +1181,153 @@ class Game:
             for i, line in enumerate(tutorial_text):
                 y_pos = start_y + (i * line_height)
                 if i == 0:  # Title text
-                    text_surface = title_font.render(line, True, GREEN)
+                    self.draw_retro_text(surface, line, title_size, GREEN, center=(screen_center_x, y_pos))
                 else:  # Regular text
-                    text_surface = text_font.render(line, True, WHITE)
-                text_rect = text_surface.get_rect(center=(screen_center_x, y_pos))
-                self.game_surface.blit(text_surface, text_rect)
-
-            # Scale and display
-            scaled_surface = pygame.transform.scale(self.game_surface, self.window_size)
-            self.screen.blit(scaled_surface, (0, 0))
-            pygame.display.flip()
-            clock.tick(60)
-
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        showing_tutorial = False
-                        return
-                    elif event.key == pygame.K_f:
-                        self.toggle_fullscreen()
+                    self.draw_retro_text(surface, line, text_size, WHITE, center=(screen_center_x, y_pos))
+
+        def handle_key(event):
+            if event.key == pygame.K_f:
+                self.toggle_fullscreen()
+            elif event.key == pygame.K_RETURN:
+                self.start_game()
+
+        return ScreenScene(self, draw, handle_key)
 
     def start_game(self):
-        self.running = True
         self.level = 1
+        self.scenes.replace(self.gameplay)
         self.next_level()
-        
-        while self.running:
-            self.clock.tick(60)
-            self.handle_events()
-            self.update()
-            self.draw()  # No arguments needed
+
+    def track_frame_time(self, frame_ms):
+        """Feed the frame's work time to the dynamic resolution controller and the stats readout."""
+        if self.presenter.supports_render_scale and self.resolution.record(frame_ms):
+            self.presenter.set_render_scale(self.resolution.scale)
+            self.full_redraw = True
+        if self.show_frame_stats and pygame.time.get_ticks() - self.stats_timer > 500:
+            self.stats_timer = pygame.time.get_ticks()
+            stats = self.resolution.report() if self.presenter.supports_render_scale else f"{frame_ms:.1f} ms, world scale 1"
+            self.presenter.set_caption(f"Dopaman - {self.clock.get_fps():.0f} fps, {stats}")
 
     def create_particles(self, position, color):
-        for _ in range(10):
-            self.particles.append([[position[0], position[1]], [random.uniform(-1, 1), random.uniform(-1, 1)], random.randint(2, 4), color])
-
-    def update_particles(self):
-        for particle in self.particles[:]:
-            particle[0][0] += particle[1][0]
-            particle[0][1] += particle[1][1]
-            particle[2] -= 0.1
-            if particle[2] <= 0:
-                self.particles.remove(particle)
-            else:
-                pygame.draw.circle(self.game_surface, particle[3], (int(particle[0][0]), int(particle[0][1])), int(particle[2]))
-
-    def draw_walls(self):
+        self.particles.emit(position, color, 10)
+
+    def draw_world_background(self, surface):
+        """Render the static part of the level; only called when the world layer is rebuilt."""
+        surface.fill(RETRO_BG_COLOR)
+        self.draw_walls(surface)
+
+    def set_starfield_background(self, enabled):
+        """Turn the gameplay starfield on or off, re-keying the cached scene to match."""
+        self.starfield_background = enabled
+        self.scene_layer.colorkey = RETRO_BG_COLOR if enabled else None
+        self.scene_layer.invalidate()
+        self.full_redraw = True
+
+    def draw_scene(self, surface):
+        """Draw the cached scene, over the scrolling starfield when it is enabled."""
+        if self.starfield_background:
+            surface.fill(RETRO_BG_COLOR)
+            self.starfield.draw(surface)
+        self.scene_layer.draw(surface)
+
+    def draw_scene_background(self, surface):
+        """Render the world layer plus collectibles; rebuilt whenever a collectible is taken."""
+        self.world_layer.draw(surface)
+        self.draw_collectibles(surface)
+
+    def draw_walls(self, surface):
         for wall in self.walls:
-            pygame.draw.rect(self.game_surface, DARK_GRAY, wall)  # Draw wall fill
-            pygame.draw.rect(self.game_surface, RED, wall, 2)    # Draw wall border
+            pygame.draw.rect(surface, DARK_GRAY, wall)  # Draw wall fill
+            pygame.draw.rect(surface, RED, wall, 2)    # Draw wall border
 
-    def draw_enemies(self):
-        label_offset = int(20 * self.uniform_scale * 0.6)
+    def draw_enemies(self, alpha=1.0):
+        label_offset = int(20 * 0.6)
         for enemy in self.enemies:
-            scaled_pos = (enemy.pos[0] * self.scale_factor_x, enemy.pos[1] * self.scale_factor_y)
-            label = self.game_font.render(enemy.name, True, RED)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
+            label = self.labels.get(enemy.name, RED)
+            x, y = interpolate(self.previous_enemy_positions.get(enemy), enemy.pos, alpha)
+            label_rect = label.get_rect(center=(x, y - label_offset))
+            self.render_queue.submit(label, label_rect, layer=ENEMY_LAYER)
 
-    def draw_mjf_helper(self):
+    def draw_mjf_helper(self, alpha=1.0):
         if hasattr(self, 'mjf_helper') and self.level >= 1:
-            self.mjf_helper.draw(self.game_surface)
+            center = interpolate(self.previous_helper_center, self.mjf_helper.rect.center, alpha)
+            self.render_queue.submit_many(self.mjf_helper.blit_entries(center), layer=HELPER_LAYER)
             
             # Draw helper info
             if self.mjf_helper.blocking:
-                text = self.game_font.render("Blocking!", True, YELLOW)
+                text = self.labels.get("Blocking!", YELLOW)
                 text_rect = text.get_rect(center=(
-                    self.mjf_helper.rect.centerx,
-                    self.mjf_helper.rect.top - 20
+                    center[0],
+                    center[1] - self.mjf_helper.rect.height // 2 - 20
                 ))
-                self.game_surface.blit(text, text_rect)
+                self.render_queue.submit(text, text_rect, layer=HELPER_LAYER)
 
-    def draw_collectibles(self):
-        scaled_radius = int(self.base_radius * self.uniform_scale)  # Removed the 0.6 multiplier to keep full size
-        label_offset = int(self.base_label_offset * self.uniform_scale)  # Removed the 0.6 multiplier
+    def draw_collectibles(self, surface):
+        radius = self.base_radius  # Removed the 0.6 multiplier to keep full size
+        label_offset = self.base_label_offset  # Removed the 0.6 multiplier
         
-        for collectible in self.dopamine_collectibles[:]:
-            scaled_pos = (collectible[0] * self.scale_factor_x, collectible[1] * self.scale_factor_y)
-            pygame.draw.circle(self.game_surface, GREEN, scaled_pos, scaled_radius)
-            label = self.game_font.render("Dopamine", True, WHITE)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
+        for collectible in self.dopamine_collectibles:
+            pygame.draw.circle(surface, GREEN, collectible, radius)
+            label = self.labels.get("Dopamine", WHITE)
+            label_rect = label.get_rect(center=(collectible[0], collectible[1] - label_offset))
+            surface.blit(label, label_rect)
         
         # Apply the same pattern for other collectibles
-        for medicine in self.medicine_collectibles[:]:
-            scaled_pos = (medicine[0] * self.scale_factor_x, medicine[1] * self.scale_factor_y)
-            pygame.draw.circle(self.game_surface, YELLOW, scaled_pos, scaled_radius)
-            label = self.game_font.render("Medicine", True, WHITE)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
-        for levodopa in self.levodopa_collectibles[:]:
-            scaled_pos = (levodopa[0] * self.scale_factor_x, levodopa[1] * self.scale_factor_y)
-            pygame.draw.circle(self.game_surface, PURPLE, scaled_pos, scaled_radius)
-            label = self.game_font.render("Levodopa", True, WHITE)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
-        for dbs in self.dbs_collectibles[:]:
-            scaled_pos = (dbs[0] * self.scale_factor_x, dbs[1] * self.scale_factor_y)
-            pygame.draw.circle(self.game_surface, ORANGE, scaled_pos, scaled_radius)
-            label = self.game_font.render("DBS", True, WHITE)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
-        for stress in self.stress_management_collectibles[:]:
-            scaled_pos = (stress[0] * self.scale_factor_x, stress[1] * self.scale_factor_y)
-            pygame.draw.circle(self.game_surface, BROWN, scaled_pos, scaled_radius)
-            label = self.game_font.render("Stress Mgmt", True, WHITE)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
-        for mirapex in self.mirapex_collectibles[:]:
-            scaled_pos = (mirapex[0] * self.scale_factor_x, mirapex[1] * self.scale_factor_y)
-            pygame.draw.circle(self.game_surface, BLUE, scaled_pos, scaled_radius)
-            label = self.game_font.render("Mirapex", True, WHITE)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
-        for speed in self.super_speed_collectibles[:]:
-            scaled_pos = (speed[0] * self.scale_factor_x, speed[1] * self.scale_factor_y)
-            pygame.draw.circle(self.game_surface, CYAN, scaled_pos, scaled_radius)
-            label = self.game_font.render("Super Speed", True, WHITE)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
-        for shield in self.shield_collectibles[:]:
-            scaled_pos = (shield[0] * self.scale_factor_x, shield[1] * self.scale_factor_y)
-            pygame.draw.circle(self.game_surface, WHITE, scaled_pos, scaled_radius)
-            label = self.game_font.render("Shield", True, RED)
-            label_rect = label.get_rect(center=(scaled_pos[0], scaled_pos[1] - label_offset))
-            self.game_surface.blit(label, label_rect)
-
-    def draw_player(self):
-        """Draw the Dopaman character on the game surface."""
-        scaled_pos = (self.player_pos[0] * self.scale_factor_x, self.player_pos[1] * self.scale_factor_y)
-        self.dopaman.set_position(scaled_pos[0], scaled_pos[1])
+        for medicine in self.medicine_collectibles:
+            pygame.draw.circle(surface, YELLOW, medicine, radius)
+            label = self.labels.get("Medicine", WHITE)
+            label_rect = label.get_rect(center=(medicine[0], medicine[1] - label_offset))
+            surface.blit(label, label_rect)
+        for levodopa in self.levodopa_collectibles:
+            pygame.draw.circle(surface, PURPLE, levodopa, radius)
+            label = self.labels.get("Levodopa", WHITE)
+            label_rect = label.get_rect(center=(levodopa[0], levodopa[1] - label_offset))
+            surface.blit(label, label_rect)
+        for dbs in self.dbs_collectibles:
+            pygame.draw.circle(surface, ORANGE, dbs, radius)
+            label = self.labels.get("DBS", WHITE)
+            label_rect = label.get_rect(center=(dbs[0], dbs[1] - label_offset))
+            surface.blit(label, label_rect)
+        for stress in self.stress_management_collectibles:
+            pygame.draw.circle(surface, BROWN, stress, radius)
+            label = self.labels.get("Stress Mgmt", WHITE)
+            label_rect = label.get_rect(center=(stress[0], stress[1] - label_offset))
+            surface.blit(label, label_rect)
+        for mirapex in self.mirapex_collectibles:
+            pygame.draw.circle(surface, BLUE, mirapex, radius)
+            label = self.labels.get("Mirapex", WHITE)
+            label_rect = label.get_rect(center=(mirapex[0], mirapex[1] - label_offset))
+            surface.blit(label, label_rect)
+        for speed in self.super_speed_collectibles:
+            pygame.draw.circle(surface, CYAN, speed, radius)
+            label = self.labels.get("Super Speed", WHITE)
+            label_rect = label.get_rect(center=(speed[0], speed[1] - label_offset))
+            surface.blit(label, label_rect)
+        for shield in self.shield_collectibles:
+            pygame.draw.circle(surface, WHITE, shield, radius)
+            label = self.labels.get("Shield", RED)
+            label_rect = label.get_rect(center=(shield[0], shield[1] - label_offset))
+            surface.blit(label, label_rect)
+
+    def build_shield_sprite(self, radius, width):
+        """Pre-render the shield ring so it joins the sprite batch instead of being drawn each frame."""
+        size = radius * 2 + 1
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, RED, (radius, radius), radius, width)
+        sprite.set_alpha(255, pygame.RLEACCEL)
+        return sprite
+
+    def draw_player(self, alpha=1.0):
+        """Queue the Dopaman character and its shield for this frame's sprite batch."""
+        x, y = interpolate(self.previous_player_pos, self.player_pos, alpha)
+        self.dopaman.set_position(x, y)
+
+        # The death effect holds the last pose and steps through the pre-tinted fade
+        if self.death_effect_timer is not None:
+            step = (pygame.time.get_ticks() - self.death_effect_timer) // self.death_effect_interval
+            tint = self.death_tints[min(step, self.death_effect_frames - 1)]
+            self.render_queue.submit(*self.dopaman.blit_entry(self.dopaman_scale_factor, tint), layer=PLAYER_LAYER)
+            return
         
         # Use the player_is_moving variable set in apply_movement
         moving = self.player_is_moving
@@ -1321,117 +1346,110 @@ class Game:
         
         # Update and draw Dopaman with scale_factor
         self.dopaman.update()
-        self.dopaman.draw(self.game_surface, scale_factor=self.dopaman_scale_factor)
+        # Flash red while taking damage
+        tint = None
+        if self.damage_animation_active and (pygame.time.get_ticks() // self.damage_flash_interval) % 2:
+            tint = self.damage_tint
+        self.render_queue.submit(*self.dopaman.blit_entry(self.dopaman_scale_factor, tint), layer=PLAYER_LAYER)
 
         # Draw shield effect if shield is active
         if self.shield_active:
-            shield_radius = int(25 * self.uniform_scale)  # Adjusted shield size
-            pygame.draw.circle(self.game_surface, RED, (int(scaled_pos[0]), int(scaled_pos[1])), shield_radius, 2)  # Reduced from 40,3
+            shield_rect = self.shield_sprite.get_rect(center=(int(x), int(y)))
+            self.render_queue.submit(self.shield_sprite, shield_rect, layer=PLAYER_LAYER)
+
+    def init_hud(self):
+        """Register the HUD widgets; each one is redrawn only when its value changes."""
+        self.hud = HUD(self.game_surface.get_size())
+        self.hud.add_widget(self.power_up_status_key, self.draw_power_up_status)
+        self.hud.add_widget(lambda: int(self.dopamine_level), self.draw_dopamine_bar)
+        self.hud.add_widget(lambda: self.lives, self.draw_lives)
+        self.hud.add_widget(lambda: self.level, self.draw_level)
+        self.hud.add_widget(lambda: self.score, self.draw_score)
+        self.hud.add_widget(lambda: self.high_score, self.draw_high_score)
+
+    def power_up_time_left(self, timer):
+        """Whole seconds left on a 5 second power-up started at timer."""
+        return max(0, (5000 - (pygame.time.get_ticks() - timer)) // 1000)
+
+    def power_up_status_key(self):
+        return (
+            self.power_up_time_left(self.super_speed_timer) if self.super_speed_active else None,
+            self.power_up_time_left(self.shield_timer) if self.shield_active else None
+        )
 
-    def draw_power_up_status(self):
-        x_offset = 50 * self.scale_factor_x
-        y_offset = (self.screen_height - 40) * self.scale_factor_y
-        font_size = int(self.base_font_size * self.uniform_scale)
-        game_font = pygame.font.SysFont("Arial", font_size)
+    def draw_power_up_status(self, surface):
+        x_offset = 50
+        y_offset = (self.screen_height - 40)
+        game_font = self.fonts.get(ARIAL, self.base_font_size)
+        drawn_rect = None
 
         if self.super_speed_active:
-            remaining_time = max(0, (5000 - (pygame.time.get_ticks() - self.super_speed_timer)) // 1000)
+            remaining_time = self.power_up_time_left(self.super_speed_timer)
             label = game_font.render(f"Super Speed: {remaining_time}s", True, CYAN)
-            self.game_surface.blit(label, (x_offset, y_offset))
-            x_offset += label.get_width() + 20 * self.scale_factor_x
+            label_rect = surface.blit(label, (x_offset, y_offset))
+            drawn_rect = label_rect
+            x_offset += label.get_width() + 20
         if self.shield_active:
-            remaining_time = max(0, (5000 - (pygame.time.get_ticks() - self.shield_timer)) // 1000)
+            remaining_time = self.power_up_time_left(self.shield_timer)
             label = game_font.render(f"Shield: {remaining_time}s", True, RED)
-            self.game_surface.blit(label, (x_offset, y_offset))
-            x_offset += label.get_width() + 20 * self.scale_factor_x
+            label_rect = surface.blit(label, (x_offset, y_offset))
+            drawn_rect = drawn_rect.union(label_rect) if drawn_rect else label_rect
+            x_offset += label.get_width() + 20
+        return drawn_rect
     # ...add other power-ups as needed...
 
-    def draw_dopamine_bar(self):
-        margin = 10 * self.scale_factor_x
-        bar_width = self.dopamine_level * 2 * self.scale_factor_x
-        bar_height = 20 * self.scale_factor_y
+    def draw_dopamine_bar(self, surface):
+        margin = 10
+        bar_width = self.dopamine_level * 2
+        bar_height = 20
         
         # Draw bar
-        pygame.draw.rect(self.game_surface, BLUE, (margin, margin, bar_width, bar_height))
+        bar_rect = pygame.draw.rect(surface, BLUE, (margin, margin, bar_width, bar_height))
         
         # Draw text
-        font_size = int(self.base_font_size * self.uniform_scale)
-        game_font = pygame.font.SysFont("Arial", font_size)
+        game_font = self.fonts.get(ARIAL, self.base_font_size)
         dopamine_text = game_font.render(f"Dopamine: {int(self.dopamine_level)}%", True, WHITE)
         text_rect = dopamine_text.get_rect(left=margin, top=bar_height + margin * 2)
-        self.game_surface.blit(dopamine_text, text_rect)
+        return bar_rect.union(surface.blit(dopamine_text, text_rect))
 
-    def draw_lives(self):
-        margin = 10 * self.scale_factor_x
-        font_size = int(self.base_font_size * self.uniform_scale)
-        game_font = pygame.font.SysFont("Arial", font_size)
+    def draw_lives(self, surface):
+        margin = 10
+        game_font = self.fonts.get(ARIAL, self.base_font_size)
         lives_text = game_font.render(f"Lives: {self.lives}", True, WHITE)
         text_rect = lives_text.get_rect(
-            right=self.screen_width * self.scale_factor_x - margin, 
+            right=self.screen_width - margin, 
             top=margin
         )
-        self.game_surface.blit(lives_text, text_rect)
+        return surface.blit(lives_text, text_rect)
 
-    def draw_level(self):
-        font_size = int(self.base_font_size * self.uniform_scale)
-        game_font = pygame.font.SysFont("Arial", font_size)
+    def draw_level(self, surface):
+        game_font = self.fonts.get(ARIAL, self.base_font_size)
         level_text = game_font.render(f"Level: {self.level}", True, WHITE)
         text_rect = level_text.get_rect(
-            centerx=self.screen_width // 2 * self.scale_factor_x, 
-            top=10 * self.scale_factor_y
+            centerx=self.screen_width // 2, 
+            top=10
         )
-        self.game_surface.blit(level_text, text_rect)
+        return surface.blit(level_text, text_rect)
 
-    def draw_score(self):
-        margin = 10 * self.scale_factor_x
-        font_size = int(self.base_font_size * self.uniform_scale)
-        game_font = pygame.font.SysFont("Arial", font_size)
+    def draw_score(self, surface):
+        margin = 10
+        game_font = self.fonts.get(ARIAL, self.base_font_size)
         score_text = game_font.render(f"Score: {self.score}", True, WHITE)
         text_rect = score_text.get_rect(
-            right=self.screen_width * self.scale_factor_x - margin,
-            top=(10 + self.base_font_size) * self.scale_factor_y
+            right=self.screen_width - margin,
+            top=(10 + self.base_font_size)
         )
-        self.game_surface.blit(score_text, text_rect)
+        return surface.blit(score_text, text_rect)
 
-    def draw_high_score(self):
-        margin = 10 * self.scale_factor_x
-        font_size = int(self.base_font_size * self.uniform_scale)
-        game_font = pygame.font.SysFont("Arial", font_size)
+    def draw_high_score(self, surface):
+        margin = 10
+        game_font = self.fonts.get(ARIAL, self.base_font_size)
         high_score_text = game_font.render(f"High Score: {self.high_score}", True, WHITE)
         text_rect = high_score_text.get_rect(
-            right=self.screen_width * self.scale_factor_x - margin,
-            top=(10 + self.base_font_size * 2) * self.scale_factor_y
+            right=self.screen_width - margin,
+            top=(10 + self.base_font_size * 2)
         )
-        self.game_surface.blit(high_score_text, text_rect)
-
-    def play_death_animation(self):
-        death_frames = 10
-        for i in range(death_frames):
-            self.game_surface.fill(RETRO_BG_COLOR)
-            self.draw_walls()
-            self.draw_enemies()
-            self.draw_mjf_helper()
-            self.draw_collectibles()
-            self.update_particles()
-            self.draw_power_up_status()
-            self.draw_dopamine_bar()
-            self.draw_lives()
-            self.draw_level()
-            self.draw_score()
-            self.draw_high_score()
-
-            # Draw player with death animation effect
-            x = self.player_pos[0] * self.scale_factor_x
-            y = self.player_pos[1] * self.scale_factor_y
-            alpha = 255 - (i * (255 // death_frames))
-            tinted_image = self.dopaman_image.copy()
-            tinted_image.fill((255, 0, 0, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-            self.game_surface.blit(tinted_image, (x - 20, y - 30))
-
-            scaled_surface = pygame.transform.scale(self.game_surface, self.screen.get_size())
-            self.screen.blit(scaled_surface, (0, 0))
-            pygame.display.flip()
-            pygame.time.delay(100)
+        return surface.blit(high_score_text, text_rect)
 
     def levodopa_effect(self):
         self.dopamine_level = min(100, self.dopamine_level + 50)
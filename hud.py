@@ -0,0 +1,74 @@
+# hud.py
+
+import pygame
+
+_UNSET = object()
+TRANSPARENT = (0, 0, 0, 0)
+
+class HUDWidget:
+    def __init__(self, key, draw):
+        self.key = key      # Returns the value the widget displays
+        self.draw = draw    # Draws the widget on a surface and returns its rect
+        self.value = _UNSET
+        self.rect = None
+
+class HUD:
+    """Keeps the rendered HUD on a cached surface and redraws only changed widgets."""
+
+    def __init__(self, size):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.widgets = []
+
+    def add_widget(self, key, draw):
+        widget = HUDWidget(key, draw)
+        self.widgets.append(widget)
+        return widget
+
+    def invalidate(self, size=None):
+        """Force every widget to redraw, e.g. after the scale or surface size changed."""
+        if size is not None and size != self.surface.get_size():
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            self.surface.fill(TRANSPARENT)
+        for widget in self.widgets:
+            widget.value = _UNSET
+            widget.rect = None
+
+    def update(self):
+        """Redraw widgets whose value changed. Returns the rects that changed."""
+        changed = []
+        for widget in self.widgets:
+            value = widget.key()
+            if value != widget.value:
+                widget.value = value
+                changed.append(widget)
+        if not changed:
+            return []
+
+        # Clear the old areas, then redraw the changed widgets and any neighbour they overlapped
+        cleared = [widget.rect for widget in changed if widget.rect]
+        for rect in cleared:
+            self.surface.fill(TRANSPARENT, rect)
+        dirty_rects = list(cleared)
+        for widget in self.widgets:
+            if widget in changed or (widget.rect and widget.rect.collidelist(cleared) != -1):
+                rect = widget.draw(self.surface)
+                widget.rect = rect if rect else None
+                if widget.rect:
+                    dirty_rects.append(widget.rect)
+        return dirty_rects
+
+    def regions(self):
+        """The rects the drawn widgets cover."""
+        return [widget.rect for widget in self.widgets if widget.rect]
+
+    def blit_sequence(self, region=None):
+        """Blit entries for the cached HUD, optionally clipped to one region."""
+        rects = self.regions()
+        if region is not None:
+            rects = [rect.clip(region) for rect in rects if rect.colliderect(region)]
+        return [(self.surface, rect, rect) for rect in rects]
+
+    def draw(self, surface):
+        """Blit the cached HUD regions onto surface in a single call."""
+        surface.blits(self.blit_sequence(), doreturn=False)
@@ -0,0 +1,84 @@
+# layers.py
+
+import pygame
+
+class StaticLayer:
+    """A layer rendered once and reused until it is invalidated or resized."""
+
+    def __init__(self, render, colorkey=None):
+        self.render = render  # Draws the layer's content onto a surface
+        self.colorkey = colorkey  # Colour left transparent so a moving background shows through
+        self.surface = None
+
+    def invalidate(self):
+        self.surface = None
+
+    def is_stale(self, size):
+        return self.surface is None or self.surface.get_size() != size
+
+    def get(self, size):
+        if self.is_stale(size):
+            self.surface = pygame.Surface(size).convert()
+            self.render(self.surface)
+            if self.colorkey is not None:
+                self.surface.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        return self.surface
+
+    def draw(self, surface):
+        surface.blit(self.get(surface.get_size()), (0, 0))
+
+    def restore(self, surface, rects):
+        """Copy the layer back over the given areas of surface."""
+        layer = self.get(surface.get_size())
+        surface.blits([(layer, rect, rect) for rect in rects], doreturn=False)
+
+class LayerStack:
+    """Full-scene layers drawn bottom to top; each run of static layers is pre-composited into one surface."""
+
+    def __init__(self, size, bg_color=None):
+        self.size = size
+        self.bg_color = bg_color  # Filled beneath the bottom layer
+        self.layers = []  # [surface, position, scroll_speed, scroll_offset], bottom first
+        self.runs = None  # Flattened draw list: ("static", surface) or ("scroll", layer)
+
+    def add(self, surface, position=(0, 0), scroll_speed=0):
+        """Stack a layer on top; a non-zero scroll_speed (pixels per second, wrapping horizontally) keeps it separate."""
+        self.layers.append([surface, position, scroll_speed, 0.0])
+        self.runs = None
+
+    def flatten(self):
+        """Merge every run of consecutive static layers into a single surface."""
+        self.runs = []
+        composite = None
+        for layer in self.layers:
+            surface, position, scroll_speed, _ = layer
+            if scroll_speed:
+                self.runs.append(("scroll", layer))
+                composite = None
+                continue
+            if composite is None:
+                if not self.runs and self.bg_color is not None:
+                    # The bottom run absorbs the background fill and becomes one opaque copy
+                    composite = pygame.Surface(self.size).convert()
+                    composite.fill(self.bg_color)
+                else:
+                    composite = pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha()
+                self.runs.append(("static", composite))
+            composite.blit(surface, position)
+
+    def draw(self, surface, dt=0):
+        """Draw the stack, advancing scrolling layers by dt milliseconds."""
+        if self.runs is None:
+            self.flatten()
+        if self.bg_color is not None and (not self.runs or self.runs[0][0] != "static"):
+            surface.fill(self.bg_color)
+        for kind, item in self.runs:
+            if kind == "static":
+                surface.blit(item, (0, 0))
+                continue
+            layer_surface, (x, y), scroll_speed, offset = item
+            width = layer_surface.get_width()
+            offset = (offset + scroll_speed * dt / 1000) % width
+            item[3] = offset
+            surface.blit(layer_surface, (x - offset, y))
+            surface.blit(layer_surface, (x - offset + width, y))
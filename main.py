@@ -1,13 +1,33 @@
+import sys
 import pygame
 from game import Game
+from presenter import SOFTWARE, TEXTURE, PARALLEL
 
 def main():
     # Initialize Pygame
     pygame.init()
     pygame.mixer.init()
     
-    # Create a game instance
-    game = Game()
+    # Create a game instance; --texture presents through the SDL2 texture renderer,
+    # --parallel scales full frames on several threads
+    if "--texture" in sys.argv:
+        render_backend = TEXTURE
+    elif "--parallel" in sys.argv:
+        render_backend = PARALLEL
+    else:
+        render_backend = SOFTWARE
+    # --fps N draws gameplay at N frames per second, 0 for as fast as possible;
+    # the simulation always steps at 60 per second
+    render_fps = 60
+    if "--fps" in sys.argv:
+        try:
+            render_fps = int(sys.argv[sys.argv.index("--fps") + 1])
+        except (IndexError, ValueError):
+            render_fps = -1
+        if render_fps < 0:
+            print("usage: main.py [--texture | --parallel] [--fps N]  (N frames per second, 0 for uncapped)")
+            sys.exit(2)
+    game = Game(render_backend=render_backend, render_fps=render_fps)
     
     # Show the start screen, difficulty selection, tutorial, and then start the game
     game.run()
@@ -2,11 +2,12 @@ import pygame
 import math
 import random
 from utils import resource_path
+from asset_formats import optimize_surface
 
 class MJFHelper:
     def __init__(self, pos, game):
-        self.image = pygame.image.load(resource_path('images/mjf.jpeg')).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (50, 50))  # Increased size for visibility
+        self.image = pygame.image.load(resource_path('images/mjf.jpeg'))
+        self.image = optimize_surface(pygame.transform.scale(self.image, (50, 50)))  # Increased size for visibility
         self.rect = self.image.get_rect()
         self.rect.center = pos
         self.game = game  # Store reference to game instance instead of dopaman
@@ -26,6 +27,25 @@ class MJFHelper:
         self.last_bounce_time = 0
         self.bounce_jitter = 30    # Random angle variation
         self.protection_active = False
+        self.build_effect_sprites()
+
+    def build_effect_sprites(self):
+        """Pre-render the translucent block flash and protection glow; rebuild if the radii change."""
+        self.block_sprite = pygame.Surface((self.block_radius * 2, self.block_radius * 2), pygame.SRCALPHA)
+        center = (self.block_radius, self.block_radius)
+        pygame.draw.circle(self.block_sprite, (255, 255, 0, 128), center, self.block_radius, 2)
+
+        self.protection_sprite = pygame.Surface((self.bounce_radius * 2, self.bounce_radius * 2), pygame.SRCALPHA)
+        center = (self.bounce_radius, self.bounce_radius)
+        pygame.draw.circle(self.protection_sprite, (255, 255, 0, 128), center, self.bounce_radius, 2)
+        # Glow rings fade in towards the protection circle
+        for radius in range(self.bounce_radius - 10, self.bounce_radius, 2):
+            alpha = int(128 * (1 - (self.bounce_radius - radius) / 10))
+            pygame.draw.circle(self.protection_sprite, (255, 255, 0, alpha), center, radius, 1)
+
+        # Mostly transparent sprites blit far faster run-length encoded
+        for sprite in (self.block_sprite, self.protection_sprite):
+            sprite.set_alpha(255, pygame.RLEACCEL)
 
     def update(self):
         # Calculate distance to player using game's player_pos
@@ -107,21 +127,26 @@ class MJFHelper:
                     
                     self.last_bounce_time = current_time
 
-    def draw(self, surface):
+    def blit_entries(self, center=None):
+        """The helper and its active effects as (surface, position) blit entries, centred on
+        center when drawing somewhere other than the helper's current position."""
+        if center is None:
+            center = self.rect.center
         # Draw MJF helper
-        surface.blit(self.image, self.rect)
+        entries = [(self.image, self.image.get_rect(center=center).topleft)]
         
         # Draw block effect when active
         if self.blocking:
             current_time = pygame.time.get_ticks()
             if (current_time // self.block_flash_interval) % 2:  # Create flashing effect
-                pygame.draw.circle(surface, (255, 255, 0, 128), self.rect.center, self.block_radius, 2)
+                entries.append((self.block_sprite, self.block_sprite.get_rect(center=center).topleft))
         
-        # Draw protection zone when active
+        # Draw protection zone and its glow when active
         if self.protection_active:
-            pygame.draw.circle(surface, (255, 255, 0, 128), self.rect.center, self.bounce_radius, 2)
-            # Add a glow effect
-            for radius in range(self.bounce_radius - 10, self.bounce_radius, 2):
-                alpha = int(128 * (1 - (self.bounce_radius - radius) / 10))
-                color = (255, 255, 0, alpha)
-                pygame.draw.circle(surface, color, self.rect.center, radius, 1)
\ No newline at end of file
+            entries.append((self.protection_sprite, self.protection_sprite.get_rect(center=center).topleft))
+        return entries
+
+    def draw(self, surface):
+        """Draw the helper and its effects; returns the rect that was drawn over."""
+        rects = surface.blits(self.blit_entries())
+        return rects[0].unionall(rects[1:])
\ No newline at end of file
@@ -0,0 +1,55 @@
+# pages.py
+
+import pygame
+from text_layout import TEXT_LAYOUT
+
+class PageCache:
+    """Lays text out once into full-screen page surfaces, reused while the layout inputs stay the same."""
+
+    def __init__(self):
+        # (layout, key, page size, text area, font, colours) -> list of page surfaces.
+        # Fonts come from a registry keyed by face and size, so the font object stands for its size.
+        self._pages = {}
+
+    def wrapped(self, key, text_lines, font, color, bg_color, size, text_rect, line_spacing=10):
+        """Word-wrap text into text_rect and split it into pages; returns the list of pages."""
+        cache_key = ("wrapped", key, size, tuple(text_rect), font, color, bg_color)
+        pages = self._pages.get(cache_key)
+        if pages is None:
+            lines = TEXT_LAYOUT.break_lines(" ".join(text_lines), font, text_rect.width)
+            line_height = font.get_linesize() + line_spacing
+            lines_per_page = max(1, text_rect.height // line_height)
+            pages = []
+            for start in range(0, max(1, len(lines)), lines_per_page):
+                page = self._blank_page(size, bg_color)
+                y = text_rect.top
+                for line in lines[start:start + lines_per_page]:
+                    page.blit(font.render(line, True, color), (text_rect.left, y))
+                    y += line_height
+                pages.append(page)
+            self._pages[cache_key] = pages
+        return pages
+
+    def centered(self, key, text_lines, font, color, bg_color, size, top, line_step):
+        """Render fixed lines centred across the page, the first centred on top; returns one page."""
+        cache_key = ("centered", key, size, (top, line_step), font, color, bg_color)
+        pages = self._pages.get(cache_key)
+        if pages is None:
+            page = self._blank_page(size, bg_color)
+            y = top
+            for line in text_lines:
+                text_surface = font.render(line, True, color)
+                page.blit(text_surface, text_surface.get_rect(center=(size[0] // 2, y)))
+                y += line_step
+            pages = [page]
+            self._pages[cache_key] = pages
+        return pages[0]
+
+    def _blank_page(self, size, bg_color):
+        # Opaque pages drawn on the background colour blit as a plain copy
+        page = pygame.Surface(size).convert()
+        page.fill(bg_color)
+        return page
+
+# Shared cache used by the prologue and the educational pages
+PAGE_CACHE = PageCache()
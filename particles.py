@@ -0,0 +1,104 @@
+# particles.py
+
+import numpy as np
+import pygame
+
+class ParticleSystem:
+    """Struct-of-arrays particle engine backed by preallocated NumPy arrays."""
+
+    def __init__(self, capacity=4096, shrink_rate=0.1):
+        self.capacity = capacity        # Maximum number of live particles
+        self.shrink_rate = shrink_rate  # Radius lost per update
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.sizes = np.zeros(capacity, dtype=np.float32)
+        self.colors = np.zeros(capacity, dtype=np.int32)  # Index into the palette
+        self.lifetimes = np.zeros(capacity, dtype=np.int32)  # Updates left to live
+        self.count = 0
+        self.palette = []  # Distinct RGB colours seen so far
+        self._stamps = np.empty((0, 0), dtype=object)  # [color index, radius] -> pre-rendered circle
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, position, color, amount=10):
+        """Spawn particles at position; anything over the budget is dropped."""
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return
+        new = slice(self.count, self.count + amount)
+        self.positions[new] = position
+        self.velocities[new] = np.random.uniform(-1, 1, (amount, 2))
+        self.sizes[new] = np.random.randint(2, 5, amount)
+        self.colors[new] = self._color_index(tuple(color))
+        self.lifetimes[new] = np.ceil(self.sizes[new] / self.shrink_rate)
+        self.count += amount
+
+    def update(self):
+        """Integrate every live particle and swap-remove the expired ones."""
+        n = self.count
+        if not n:
+            return
+        self.positions[:n] += self.velocities[:n]
+        self.sizes[:n] -= self.shrink_rate
+        self.lifetimes[:n] -= 1
+
+        alive = self.lifetimes[:n] > 0
+        new_count = int(np.count_nonzero(alive))
+        if new_count < n:
+            # Fill holes below new_count with the survivors stored above it
+            holes = np.flatnonzero(~alive[:new_count])
+            movers = np.flatnonzero(alive[new_count:]) + new_count
+            for array in (self.positions, self.velocities, self.sizes, self.colors, self.lifetimes):
+                array[holes] = array[movers]
+            self.count = new_count
+
+    def draw(self, surface, alpha=1.0):
+        """Blit every particle in one batch, alpha of the way through the last update's move;
+        returns the rects that were drawn over."""
+        n = self.count
+        if not n:
+            return []
+        radii = self.sizes[:n].astype(np.int32)
+        visible = np.flatnonzero(radii > 0)
+        if not len(visible):
+            return []
+        radii = radii[visible]
+        positions = self.positions[visible]
+        if alpha != 1.0:
+            positions = positions - self.velocities[visible] * (1.0 - alpha)
+        corners = positions.astype(np.int32) - radii[:, None]
+        stamps = self._stamps_for(int(radii.max()))[self.colors[visible], radii]
+        surface.blits(zip(stamps.tolist(), corners.tolist()), doreturn=False)
+
+        # One rect around the whole effect keeps dirty-rect bookkeeping cheap
+        left, top = corners.min(axis=0)
+        right, bottom = (corners + 2 * radii[:, None]).max(axis=0)
+        return [pygame.Rect(int(left), int(top), int(right - left), int(bottom - top))]
+
+    def _color_index(self, color):
+        if color not in self.palette:
+            self.palette.append(color)
+        return self.palette.index(color)
+
+    def _stamps_for(self, max_radius):
+        """Table of pre-rendered circles covering every palette colour up to max_radius."""
+        rows, cols = self._stamps.shape
+        if rows < len(self.palette) or cols <= max_radius:
+            table = np.empty((len(self.palette), max(cols, max_radius + 1)), dtype=object)
+            for index, color in enumerate(self.palette):
+                for radius in range(1, table.shape[1]):
+                    table[index, radius] = self._render_stamp(color, radius)
+            self._stamps = table
+        return self._stamps
+
+    def _render_stamp(self, color, radius):
+        key = (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+        stamp = pygame.Surface((radius * 2, radius * 2)).convert()
+        stamp.fill(key)
+        pygame.draw.circle(stamp, color, (radius, radius), radius)
+        stamp.set_colorkey(key, pygame.RLEACCEL)
+        return stamp
@@ -0,0 +1,323 @@
+# presenter.py
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+try:
+    from pygame._sdl2 import video
+except ImportError:  # pygame built without the SDL2 video bindings
+    video = None
+
+# Presentation backends
+SOFTWARE = "software"  # Blit and scale on the CPU into the display surface
+TEXTURE = "texture"    # Stream frames into an SDL texture and let the renderer scale them
+PARALLEL = "parallel"  # Software, with the full-frame scale split into stripes across threads
+
+# Presentation paths
+DIRECT = "direct"    # Window matches the logical size; blit straight to the screen
+INTEGER = "integer"  # Window fits a whole multiple of the logical size
+SCALED = "scaled"    # Any other size; scale into the letterboxed viewport
+
+def fit_viewport(logical_size, window_size, integer_scaling=False):
+    """Pick the presentation path, scale and centred viewport for a window; returns (mode, scale, viewport)."""
+    logical_w, logical_h = logical_size
+    window_w, window_h = window_size
+    fit = min(window_w / logical_w, window_h / logical_h)
+
+    if tuple(window_size) == tuple(logical_size):
+        mode = DIRECT
+    elif fit >= 1 and (fit == int(fit) or integer_scaling):
+        mode = INTEGER
+    else:
+        mode = SCALED
+    scale = int(fit) if mode != SCALED else fit
+
+    # Keep the aspect ratio and centre the picture, letterboxing the rest
+    viewport = pygame.Rect((0, 0), (int(logical_w * scale), int(logical_h * scale)))
+    viewport.center = (window_w // 2, window_h // 2)
+    return mode, scale, viewport
+
+def create_presenter(logical_size, backend=SOFTWARE):
+    """Build the presenter for a backend, falling back to software blitting without SDL2 texture support."""
+    if backend == TEXTURE and video is not None:
+        return TexturePresenter(logical_size)
+    if backend == PARALLEL:
+        return ParallelPresenter(logical_size)
+    return Presenter(logical_size)
+
+class Presenter:
+    """Owns the single mapping from the logical game surface to the window."""
+
+    backend = SOFTWARE
+
+    def __init__(self, logical_size):
+        self.logical_size = logical_size
+        self.screen = None
+        self.mode = DIRECT
+        self.scale = 1
+        self.viewport = pygame.Rect((0, 0), logical_size)
+        self.target = None  # Screen subsurface covering the viewport
+        self.buffer = None  # Logical-sized frame buffer used when the screen is scaled
+        self.render_scale = 1.0  # Fraction of the viewport resolution the world is scaled to
+        self.world_buffer = None
+
+    def set_mode(self, size, flags=0, bg_color=(0, 0, 0)):
+        """Open or change the window; returns the display surface."""
+        screen = pygame.display.set_mode(size, flags)
+        self.resize(screen, bg_color)
+        return screen
+
+    @property
+    def window_size(self):
+        return self.screen.get_size()
+
+    def resize(self, screen, bg_color=(0, 0, 0)):
+        """Recompute the viewport and preallocate surfaces for a new display surface."""
+        self.screen = screen
+        self.mode, self.scale, self.viewport = fit_viewport(self.logical_size, screen.get_size())
+
+        if self.mode == DIRECT:
+            self.target = None
+            self.buffer = None
+        else:
+            screen.fill(bg_color)
+            self.target = screen.subsurface(self.viewport)
+            self.buffer = pygame.Surface(self.logical_size).convert()
+        self.set_render_scale(self.render_scale)
+
+    @property
+    def supports_regions(self):
+        """Whether partial updates can be presented without rescaling the whole frame."""
+        return self.mode in (DIRECT, INTEGER)
+
+    @property
+    def supports_render_scale(self):
+        """Whether a lower world render scale saves work; only the fractional scaling path has any to save."""
+        return self.mode == SCALED
+
+    def set_render_scale(self, scale):
+        """Scale the world to a fraction of the viewport before stretching it; 0.5 pixel-doubles cheaply."""
+        self.render_scale = scale
+        self.world_buffer = None
+        if scale < 1 and self.mode == SCALED:
+            world_size = (round(self.viewport.width * scale), round(self.viewport.height * scale))
+            self.world_buffer = pygame.Surface(world_size).convert()
+
+    def set_caption(self, text):
+        pygame.display.set_caption(text)
+
+    def frame_surface(self):
+        """The logical-sized surface a final frame should be composed onto."""
+        return self.screen if self.mode == DIRECT else self.buffer
+
+    def present(self, surface, rects=None, crisp_rects=()):
+        """Show surface on the window, optionally only the given logical rects.
+
+        crisp_rects, e.g. the HUD, are always scaled from full resolution.
+        """
+        if self.mode == DIRECT:
+            if surface is not self.screen:
+                self.screen.blit(surface, (0, 0))
+        elif rects is not None and self.mode == INTEGER:
+            rects = [self._scale_region(surface, rect) for rect in rects]
+        elif self.world_buffer is not None:
+            # Scaling cost follows the pixels written, and an exact doubling is pygame's cheapest stretch
+            pygame.transform.scale(surface, self.world_buffer.get_size(), self.world_buffer)
+            self._scale_frame(self.world_buffer)
+            for rect in crisp_rects:
+                self._scale_region(surface, rect)
+            rects = None
+        else:
+            self._scale_frame(surface)
+            rects = None
+
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def _scale_frame(self, surface):
+        """Stretch a whole frame over the viewport."""
+        pygame.transform.scale(surface, self.viewport.size, self.target)
+
+    def _scale_region(self, surface, rect):
+        """Scale one logical rect into the window; returns the window rect it covers."""
+        left, top = int(rect.left * self.scale), int(rect.top * self.scale)
+        window_rect = pygame.Rect(left, top, int(rect.right * self.scale) - left, int(rect.bottom * self.scale) - top)
+        pygame.transform.scale(surface.subsurface(rect), window_rect.size, self.target.subsurface(window_rect))
+        return window_rect.move(self.viewport.topleft)
+
+class ParallelPresenter(Presenter):
+    """Software presenter that stretches full frames as horizontal stripes on a thread pool.
+
+    pygame releases the GIL while it scales, so the stripes, each written into its own
+    subsurface of the window, run on separate cores.
+    """
+
+    backend = PARALLEL
+
+    def __init__(self, logical_size, workers=4):
+        self.workers = workers
+        self.pool = ThreadPoolExecutor(max_workers=workers - 1, thread_name_prefix="present") if workers > 1 else None
+        self.stripes = {}  # source size -> [(source rect, target subsurface)]
+        super().__init__(logical_size)
+
+    def resize(self, screen, bg_color=(0, 0, 0)):
+        self.stripes.clear()
+        super().resize(screen, bg_color)
+
+    def _stripes_for(self, source_size):
+        stripes = self.stripes.get(source_size)
+        if stripes is None:
+            source_w, source_h = source_size
+            target_h = self.viewport.height
+            # Cut only on rows where source and target line up exactly, so each stripe
+            # samples the same source rows the single full-frame stretch would
+            units = math.gcd(source_h, target_h)
+            count = min(self.workers, units)
+            stripes = []
+            for index in range(count):
+                top = target_h * (units * index // count) // units
+                bottom = target_h * (units * (index + 1) // count) // units
+                source_rect = pygame.Rect(0, top * source_h // target_h, source_w, (bottom - top) * source_h // target_h)
+                stripes.append((source_rect, self.target.subsurface((0, top, self.viewport.width, bottom - top))))
+            self.stripes[source_size] = stripes
+        return stripes
+
+    def _scale_frame(self, surface):
+        stripes = self._stripes_for(surface.get_size())
+        if self.pool is None or len(stripes) == 1:
+            super()._scale_frame(surface)
+            return
+        jobs = [(surface.subsurface(source_rect), target) for source_rect, target in stripes]
+        # The calling thread takes the last stripe instead of waiting idle
+        futures = [self.pool.submit(pygame.transform.scale, source, target.get_size(), target) for source, target in jobs[:-1]]
+        source, target = jobs[-1]
+        pygame.transform.scale(source, target.get_size(), target)
+        for future in futures:
+            future.result()
+
+class TexturePresenter:
+    """Streams finished frames into one SDL texture and lets the renderer scale it onto the window.
+
+    The display module keeps a hidden window of the logical size so surfaces can still be
+    convert()ed; the picture itself goes to a separate window owned by the renderer.
+    """
+
+    backend = TEXTURE
+
+    def __init__(self, logical_size, integer_scaling=False):
+        self.logical_size = logical_size
+        self.integer_scaling = integer_scaling  # Whole-number scales only, letterboxing the remainder
+        self.screen = None  # Hidden display surface
+        self.window = None
+        self.renderer = None
+        self.accelerated = False  # False when SDL's software renderer is doing the work
+        self.texture = None
+        self.buffer = None  # Logical-sized frame buffer mirrored into the texture
+        self.bg_color = (0, 0, 0)
+        self.mode = DIRECT
+        self.scale = 1
+        self.viewport = pygame.Rect((0, 0), logical_size)
+        self.render_scale = 1.0
+
+    def set_mode(self, size, flags=0, bg_color=(0, 0, 0)):
+        """Open or change the window; returns the hidden display surface."""
+        if self.window is None:
+            self.screen = pygame.display.set_mode(self.logical_size, pygame.HIDDEN)
+            self.window = video.Window(pygame.display.get_caption()[0] or "pygame", size)
+            self.renderer = self._create_renderer()
+            self.texture = video.Texture(self.renderer, self.logical_size, streaming=True)
+            self.buffer = pygame.Surface(self.logical_size).convert()
+
+        if flags & pygame.FULLSCREEN:
+            self.window.set_fullscreen(desktop=True)
+        else:
+            self.window.set_windowed()
+            self.window.size = size
+        self.bg_color = bg_color
+        self.mode, self.scale, self.viewport = fit_viewport(self.logical_size, self.window.size, self.integer_scaling)
+        return self.screen
+
+    def _create_renderer(self):
+        # Prefer the GPU, then SDL's software renderer, which needs no graphics hardware at all
+        try:
+            renderer = video.Renderer(self.window, accelerated=1)
+            self.accelerated = True
+        except video.error:
+            renderer = video.Renderer(self.window, accelerated=0)
+            self.accelerated = False
+        return renderer
+
+    @property
+    def window_size(self):
+        return self.window.size
+
+    @property
+    def supports_regions(self):
+        """Changed regions are uploaded on their own; the renderer rescales the whole texture anyway."""
+        return True
+
+    @property
+    def supports_render_scale(self):
+        """The renderer stretches the texture itself, so there is no CPU scaling to shed."""
+        return False
+
+    def set_render_scale(self, scale):
+        pass
+
+    def set_caption(self, text):
+        self.window.title = text
+
+    def frame_surface(self):
+        """The logical-sized surface a final frame should be composed onto."""
+        return self.buffer
+
+    def present(self, surface, rects=None, crisp_rects=()):
+        """Upload surface, or only the given logical rects of it, and show it on the window."""
+        if rects is None:
+            self.texture.update(surface)
+        else:
+            for rect in rects:
+                self.texture.update(surface.subsurface(rect), rect)
+
+        self.renderer.draw_color = pygame.Color(self.bg_color)
+        self.renderer.clear()
+        self.texture.draw(dstrect=self.viewport)
+        self.renderer.present()
+
+        # The hidden display window keeps SDL from sending QUIT when this window closes
+        if pygame.event.get(pygame.WINDOWCLOSE):
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import time
+    parser = argparse.ArgumentParser(description="Benchmark full-frame presentation with 1, 2, 4 and 8 scaling workers.")
+    parser.add_argument("--frames", type=int, default=200, help="Frames presented per measurement")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to compare")
+    args = parser.parse_args()
+
+    pygame.init()
+    logical_size = (800, 600)
+    display_sizes = [(1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+    print(f"{os.cpu_count()} CPUs, {args.frames} frames per run, ms per presented frame")
+    print("display      " + "".join(f"{workers:>9} w" for workers in args.workers))
+    for size in display_sizes:
+        timings = []
+        for workers in args.workers:
+            presenter = ParallelPresenter(logical_size, workers)
+            presenter.set_mode(size)
+            frame = pygame.Surface(logical_size).convert()
+            frame.fill((40, 40, 80))
+            presenter.present(frame)  # Warm up the stripes and the pool
+            start = time.perf_counter()
+            for _ in range(args.frames):
+                presenter.present(frame)
+            timings.append((time.perf_counter() - start) / args.frames * 1000)
+            if presenter.pool:
+                presenter.pool.shutdown()
+        print(f"{size[0]}x{size[1]:<8}" + "".join(f"{timing:>11.2f}" for timing in timings))
+    pygame.quit()
@@ -0,0 +1,35 @@
+# render_queue.py
+
+# Gameplay draw layers, bottom to top
+ENEMY_LAYER = 10
+HELPER_LAYER = 20
+PLAYER_LAYER = 30
+
+class RenderQueue:
+    """Collects a frame's blits by layer and hands them to SDL in one Surface.blits call."""
+
+    def __init__(self):
+        self._layers = {}  # layer -> list of blit entries in submission order
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._layers.values())
+
+    def submit(self, surface, dest, area=None, layer=0):
+        """Queue one blit; entries on the same layer keep their submission order."""
+        entry = (surface, dest) if area is None else (surface, dest, area)
+        self._layers.setdefault(layer, []).append(entry)
+
+    def submit_many(self, entries, layer=0):
+        """Queue ready-made (surface, dest[, area]) entries."""
+        self._layers.setdefault(layer, []).extend(entries)
+
+    def flush(self, target, doreturn=True):
+        """Blit everything queued onto target, lowest layer first; returns the drawn rects if asked."""
+        sequence = []
+        for layer in sorted(self._layers):
+            sequence += self._layers[layer]
+        self._layers.clear()
+        if not sequence:
+            return []
+        rects = target.blits(sequence, doreturn=doreturn)
+        return rects if doreturn else []
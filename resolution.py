@@ -0,0 +1,74 @@
+# resolution.py
+
+FRAME_BUDGET_MS = 1000 / 60
+
+class DynamicResolution:
+    """Steps the world render scale down when frames overrun the budget and back up once there is headroom.
+
+    Stepping up needs the frame time plus the saving the lower step bought to fit under
+    budget * headroom, so a scale that only just fits never flips back and forth.
+    """
+
+    def __init__(self, steps=(1.0, 0.5), budget_ms=FRAME_BUDGET_MS, headroom=0.85, smoothing=0.1, down_frames=30, up_frames=180):
+        self.steps = steps
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.down_frames = down_frames  # Frames over budget before dropping a step
+        self.up_frames = up_frames      # Frames with headroom before raising a step
+        self.reset()
+
+    def reset(self):
+        """Back to full scale with no history, e.g. after the window changed size."""
+        self.level = 0
+        self.savings = {}  # level -> milliseconds saved by stepping down to it
+        self._start_level()
+
+    def _start_level(self, exit_ms=None):
+        self.average_ms = None
+        self.frames = 0
+        self._exit_ms = exit_ms  # Smoothed frame time at the step just left
+        self._over = 0
+        self._under = 0
+
+    @property
+    def scale(self):
+        return self.steps[self.level]
+
+    def record(self, frame_ms):
+        """Add one frame's work time; returns True when the scale changed."""
+        if self.average_ms is None:
+            self.average_ms = frame_ms
+        else:
+            self.average_ms += (frame_ms - self.average_ms) * self.smoothing
+        self.frames += 1
+
+        # Once settled after a step down, note how much the lower scale saved
+        if self._exit_ms is not None and self.frames == self.down_frames:
+            self.savings[self.level] = max(0.0, self._exit_ms - self.average_ms)
+
+        if self.average_ms > self.budget_ms:
+            self._over += 1
+            self._under = 0
+        elif self.level in self.savings and self.average_ms + self.savings[self.level] < self.budget_ms * self.headroom:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if self._over >= self.down_frames and self.level < len(self.steps) - 1:
+            exit_ms = self.average_ms
+            self.level += 1
+            self._start_level(exit_ms)
+            return True
+        if self._under >= self.up_frames:
+            self.level -= 1
+            self._start_level()
+            return True
+        return False
+
+    def report(self):
+        """One-line summary for instrumentation."""
+        average = self.average_ms or 0.0
+        return f"{average:.1f}/{self.budget_ms:.1f} ms, world scale {self.scale:g}"
@@ -0,0 +1,222 @@
+# scenes.py
+
+import sys
+import time
+import pygame
+from timestep import SIM_RATE
+
+# Window events after which a kept frame only needs showing again
+WINDOW_EVENTS = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+
+class Scene:
+    """One screen of the game, driven by SceneStack's main loop.
+
+    interval sets the pacing: 0 updates and draws every frame, a number of milliseconds
+    updates that often, and None only redraws after a key press. Scenes that are not run
+    every frame keep their last frame on the surface while the loop sleeps.
+    """
+
+    interval = 0
+    fps = None  # Frame rate for scenes run every frame; None follows the stack's display rate
+
+    def __init__(self, game):
+        self.game = game
+        self.stack = None  # Set while the scene is on a stack
+
+    def enter(self):
+        """Called once the scene has been pushed."""
+
+    def resume(self):
+        """Called when the scene above this one has been popped."""
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, elapsed):
+        """Advance by elapsed milliseconds; an animated screen returns False once it has settled."""
+        return True
+
+    def draw(self):
+        """Compose the frame and present it."""
+
+    def present(self):
+        """Show the kept frame again, e.g. after the window was exposed."""
+        self.game.presenter.present(self.game.game_surface)
+
+class ScreenScene(Scene):
+    """A mostly static screen: compose(surface) draws all of it, redrawn after each key press and animation tick."""
+
+    def __init__(self, game, compose, handle_key, tick=None, interval=None):
+        super().__init__(game)
+        self.compose = compose
+        self.handle_key = handle_key
+        self.tick = tick
+        self.interval = interval
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            self.handle_key(event)
+
+    def update(self, elapsed):
+        return self.tick(elapsed)
+
+    def draw(self):
+        self.compose(self.game.game_surface)
+        self.present()
+
+class GameplayScene(Scene):
+    """The level being played: simulated in fixed steps, drawn once per frame in between them."""
+
+    def enter(self):
+        self.game.timestep.reset()
+        self.game.store_positions()
+
+    def resume(self):
+        # Whatever covered the world replaced the whole frame
+        self.game.full_redraw = True
+        self.enter()
+
+    def handle_event(self, event):
+        self.game.handle_event(event)
+
+    def update(self, elapsed):
+        self.frame_start = time.perf_counter()
+        for _ in range(self.game.timestep.advance(elapsed)):
+            self.game.store_positions()
+            self.game.update()
+            if self.stack.top is not self:
+                break  # A cutscene or the game-over screen took over
+
+    def draw(self):
+        self.game.draw(self.game.timestep.alpha)
+        self.game.track_frame_time((time.perf_counter() - self.frame_start) * 1000)
+
+class CutsceneScene(Scene):
+    """Plays a cutscene generator, which draws and presents a frame for each (elapsed_ms, events) sent to it."""
+
+    fps = SIM_RATE  # Cutscene motion is per frame, so it keeps the game's 60 fps whatever the display rate
+
+    def __init__(self, game, cutscene):
+        super().__init__(game)
+        self.cutscene = cutscene
+        self.events = []
+        self.elapsed = 0
+
+    def enter(self):
+        # Run the setup up to the opening frame
+        self.advance(None)
+
+    def handle_event(self, event):
+        self.events.append(event)
+
+    def update(self, elapsed):
+        self.elapsed = elapsed
+
+    def draw(self):
+        events, self.events = self.events, []
+        self.advance((self.elapsed, events))
+
+    def advance(self, frame):
+        try:
+            self.cutscene.send(frame)
+        except StopIteration:
+            self.stack.pop()
+
+class SceneStack:
+    """The game's one main loop: events, updates, drawing and frame pacing for whichever scene is on top.
+
+    Transitions only change the stack, so restarting or finishing a scene never nests loops.
+    """
+
+    def __init__(self, clock, fps=60):
+        self.clock = clock
+        self.fps = fps
+        self.scenes = []
+        self._changed()
+
+    @property
+    def top(self):
+        return self.scenes[-1] if self.scenes else None
+
+    def push(self, scene):
+        scene.stack = self
+        self.scenes.append(scene)
+        self._changed()
+        scene.enter()
+
+    def pop(self):
+        scene = self.scenes.pop()
+        scene.stack = None
+        self._changed()
+        if self.scenes:
+            self.scenes[-1].resume()
+        return scene
+
+    def replace(self, scene):
+        """Swap the top scene for another without resuming the one below."""
+        self.scenes.pop().stack = None
+        self.push(scene)
+
+    def clear(self):
+        """Drop every scene, which ends the main loop."""
+        for scene in self.scenes:
+            scene.stack = None
+        self.scenes = []
+
+    def _changed(self):
+        self.redraw = True
+        self.last_tick = pygame.time.get_ticks()
+        self.entered = True
+
+    def run(self):
+        while self.scenes:
+            scene = self.scenes[-1]
+            if scene.interval == 0:
+                elapsed = self.clock.tick(scene.fps or self.fps)
+                if self.entered:
+                    # Time spent on the previous scene is not this one's to catch up on
+                    elapsed = 0
+                events = pygame.event.get()
+            else:
+                if self.redraw:
+                    scene.draw()
+                events = self._wait(scene.interval)
+            self.redraw = False
+            self.entered = False
+
+            for event in events:
+                if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+                    pygame.quit()
+                    sys.exit()
+                if not self.scenes:
+                    return
+                top = self.scenes[-1]
+                top.handle_event(event)
+                if top.interval != 0 and top is self.top:
+                    if event.type == pygame.KEYDOWN:
+                        self.redraw = True
+                    elif event.type in WINDOW_EVENTS and not self.redraw:
+                        top.present()
+
+            if self.top is not scene:
+                continue  # The new top scene starts on the next pass
+
+            if scene.interval == 0:
+                scene.update(elapsed)
+                if self.top is scene:
+                    scene.draw()
+            elif scene.interval is not None:
+                now = pygame.time.get_ticks()
+                if now - self.last_tick >= scene.interval:
+                    if not scene.update(now - self.last_tick):
+                        scene.interval = None
+                    self.last_tick = now
+                    self.redraw = True
+
+    def _wait(self, interval):
+        """Sleep until an event arrives or the next animation tick is due."""
+        if interval is not None:
+            events = [pygame.event.wait(max(1, int(self.last_tick + interval - pygame.time.get_ticks())))]
+        else:
+            events = [pygame.event.wait()]
+        return events + pygame.event.get()
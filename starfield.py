@@ -0,0 +1,68 @@
+# starfield.py
+
+import numpy as np
+import pygame
+
+# Parallax layers as (count, min_speed, max_speed, radius, color); radius 0 draws single pixels
+DEFAULT_LAYERS = (
+    (400, 0.05, 0.1, 0, (90, 90, 90)),      # Distant dust
+    (60, 0.1, 0.25, 1, (255, 255, 255)),
+    (30, 0.25, 0.4, 2, (255, 255, 255)),
+    (10, 0.4, 0.5, 3, (255, 255, 255)),     # Nearest, fastest stars
+)
+
+class Starfield:
+    """Vertically scrolling parallax starfield stored in NumPy arrays."""
+
+    def __init__(self, size, layers=DEFAULT_LAYERS):
+        self.width, self.height = size
+        count = sum(layer[0] for layer in layers)
+        self.x = np.zeros(count, dtype=np.float32)
+        self.y = np.zeros(count, dtype=np.float32)
+        self.speeds = np.zeros(count, dtype=np.float32)
+        self.layers = []  # (slice into the arrays, radius, color, stamp) per parallax layer
+
+        start = 0
+        for layer_count, min_speed, max_speed, radius, color in layers:
+            stars = slice(start, start + layer_count)
+            self.x[stars] = np.random.uniform(0, self.width, layer_count)
+            self.y[stars] = np.random.uniform(0, self.height, layer_count)
+            self.speeds[stars] = np.random.uniform(min_speed, max_speed, layer_count)
+            self.layers.append((stars, radius, color, self._render_stamp(color, radius)))
+            start += layer_count
+
+    def __len__(self):
+        return len(self.x)
+
+    def update(self, dt=1.0):
+        """Advance every star by dt frames, wrapping those that leave the bottom edge."""
+        self.y += self.speeds * dt
+        wrapped = self.y >= self.height
+        if wrapped.any():
+            self.y[wrapped] -= self.height
+            self.x[wrapped] = np.random.uniform(0, self.width, int(np.count_nonzero(wrapped)))
+
+    def draw(self, surface):
+        """Draw every layer, farthest first, with one bulk write or blit batch per layer."""
+        for stars, radius, color, stamp in self.layers:
+            xs = self.x[stars].astype(np.int32)
+            ys = self.y[stars].astype(np.int32)
+            if radius == 0 and surface.get_bytesize() in (1, 2, 4):
+                pixels = pygame.surfarray.pixels2d(surface)
+                pixels[xs, ys] = surface.map_rgb(color)
+                del pixels  # Unlock the surface
+            else:
+                corners = np.column_stack((xs - radius, ys - radius)).tolist()
+                surface.blits([(stamp, corner) for corner in corners], doreturn=False)
+
+    def _render_stamp(self, color, radius):
+        if radius == 0:
+            stamp = pygame.Surface((1, 1)).convert()
+            stamp.fill(color)
+            return stamp
+        key = (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+        stamp = pygame.Surface((radius * 2, radius * 2)).convert()
+        stamp.fill(key)
+        pygame.draw.circle(stamp, color, (radius, radius), radius)
+        stamp.set_colorkey(key, pygame.RLEACCEL)
+        return stamp
@@ -1,6 +1,7 @@
 import pygame
 import sys
-from utils import resource_path
+from utils import resource_path, render_text_wrapped
+from asset_formats import load_image
 
 # Initialize Pygame
 pygame.init()
@@ -10,30 +11,6 @@ WHITE = (255, 255, 255)
 YELLOW = (255, 255, 0)
 BLACK = (0, 0, 0)
 
-def render_text_wrapped(surface, text, font, color, rect, bg_color=None):
-    words = text.split()
-    lines = []
-    line = ""
-    for word in words:
-        test_line = line + word + " "
-        text_width, _ = font.size(test_line)
-        if text_width < rect.width:
-            line = test_line
-        else:
-            lines.append(line)
-            line = word + " "
-    if line:
-        lines.append(line)
-    
-    y = rect.top
-    for line in lines:
-        if bg_color:
-            text_surface = font.render(line.strip(), True, color, bg_color)
-        else:
-            text_surface = font.render(line.strip(), True, color)
-        surface.blit(text_surface, (rect.left, y))
-        y += font.get_linesize()
-
 def show_level_story(
     game_surface, screen, level, EDUCATIONAL_CONTENT, retro_font, retro_small_font, retro_bg_color,
     player_image, mjf_helper_image, enemy_image
@@ -69,9 +46,9 @@ def show_cutscene_1(game_surface, screen, retro_small_font, retro_bg_color, play
 
     # Load the layered background images
     try:
-        background_layer = pygame.image.load(resource_path('sjy.png')).convert()
-        middle_layer = pygame.image.load(resource_path('city.png')).convert_alpha()
-        foreground_layer = pygame.image.load(resource_path('illustration.png')).convert_alpha()
+        background_layer = load_image(resource_path('sjy.png'))
+        middle_layer = load_image(resource_path('city.png'))
+        foreground_layer = load_image(resource_path('illustration.png'))
     except pygame.error as e:
         print(f"Error loading images: {e}")
         pygame.quit()
@@ -166,7 +143,7 @@ def show_cutscene_2(game_surface, screen, retro_small_font, retro_bg_color, play
 
     # Load and scale background image
     try:
-        background_image = pygame.image.load(resource_path('substantia_nigra_towers.png')).convert()
+        background_image = load_image(resource_path('substantia_nigra_towers.png'))
     except pygame.error as e:
         print(f"Error loading image: {e}")
         pygame.quit()
@@ -255,9 +232,9 @@ def show_cutscene_3(game_surface, screen, retro_small_font, retro_bg_color, play
     # Load allies images
     try:
         allies_images = [
-            pygame.image.load(resource_path('ally_medication.png')).convert_alpha(),
-            pygame.image.load(resource_path('ally_dbs.png')).convert_alpha(),
-            pygame.image.load(resource_path('ally_exercise.png')).convert_alpha()
+            load_image(resource_path('ally_medication.png')),
+            load_image(resource_path('ally_dbs.png')),
+            load_image(resource_path('ally_exercise.png'))
         ]
     except pygame.error as e:
         print(f"Error loading images: {e}")
@@ -270,7 +247,7 @@ def show_cutscene_3(game_surface, screen, retro_small_font, retro_bg_color, play
 
     # Load and scale background image
     try:
-        background_image = pygame.image.load(resource_path('holographic_interface.png')).convert()
+        background_image = load_image(resource_path('holographic_interface.png'))
     except pygame.error as e:
         print(f"Error loading image: {e}")
         pygame.quit()
@@ -398,7 +375,7 @@ def show_cutscene_4(game_surface, screen, retro_small_font, retro_bg_color, play
 
     # Load and scale background image
     try:
-        background_image = pygame.image.load(resource_path('neurocity_rebuilt.png')).convert()
+        background_image = load_image(resource_path('neurocity_rebuilt.png'))
     except pygame.error as e:
         print(f"Error loading image: {e}")
         pygame.quit()
@@ -521,9 +498,9 @@ if __name__ == "__main__":
 
     # Load images
     try:
-        player_image = pygame.image.load(resource_path('dopaman.png')).convert_alpha()
-        mjf_helper_image = pygame.image.load(resource_path('mjf_helper.png')).convert_alpha()
-        enemy_image = pygame.image.load(resource_path('parkinon.png')).convert_alpha()
+        player_image = load_image(resource_path('dopaman.png'))
+        mjf_helper_image = load_image(resource_path('mjf_helper.png'))
+        enemy_image = load_image(resource_path('parkinon.png'))
     except pygame.error as e:
         print(f"Error loading images: {e}")
         pygame.quit()
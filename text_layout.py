@@ -0,0 +1,69 @@
+# text_layout.py
+
+from collections import OrderedDict
+import pygame
+
+class TextLayout:
+    """Word-wraps text from cached word widths and keeps the most recently rendered paragraphs."""
+
+    def __init__(self, max_paragraphs=64):
+        self.max_paragraphs = max_paragraphs
+        self._widths = {}  # font -> {word: width in pixels}
+        self._paragraphs = OrderedDict()  # (text, font, color, width, bg_color) -> surface, least recent first
+
+    def word_width(self, font, word):
+        """Width of word in font, measured once."""
+        widths = self._widths.setdefault(font, {})
+        width = widths.get(word)
+        if width is None:
+            width = widths[word] = font.size(word)[0]
+        return width
+
+    def break_lines(self, text, font, width):
+        """Greedily fill lines narrower than width using the cached word widths."""
+        space = self.word_width(font, " ")
+        lines = []
+        line = []
+        line_width = 0  # Width of the words in line, each followed by a space
+        for word in text.split():
+            word_width = self.word_width(font, word) + space
+            if line and line_width + word_width >= width:
+                lines.append(" ".join(line))
+                line = []
+                line_width = 0
+            line.append(word)
+            line_width += word_width
+        if line:
+            lines.append(" ".join(line))
+        return lines
+
+    def render(self, text, font, color, width, bg_color=None):
+        """Return text laid out to width as one surface, re-rendering only on a cache miss."""
+        key = (text, font, color, width, bg_color)
+        paragraph = self._paragraphs.get(key)
+        if paragraph is not None:
+            self._paragraphs.move_to_end(key)
+            return paragraph
+
+        lines = self.break_lines(text, font, width)
+        line_height = font.get_linesize()
+        paragraph = pygame.Surface((width, max(1, line_height * len(lines))), pygame.SRCALPHA)
+        for index, line in enumerate(lines):
+            if bg_color:
+                line_surface = font.render(line, True, color, bg_color)
+            else:
+                line_surface = font.render(line, True, color)
+            # Copy the glyph coverage as-is rather than blending it against the transparent page
+            paragraph.blit(line_surface, (0, index * line_height), special_flags=pygame.BLEND_RGBA_MAX)
+
+        self._paragraphs[key] = paragraph
+        if len(self._paragraphs) > self.max_paragraphs:
+            self._paragraphs.popitem(last=False)
+        return paragraph
+
+    def draw(self, surface, text, font, color, rect, bg_color=None):
+        """Draw text wrapped to rect.width with its top-left at rect; returns the drawn rect."""
+        return surface.blit(self.render(text, font, color, rect.width, bg_color), rect.topleft)
+
+# Shared layout cache used by dialogue boxes and text pages
+TEXT_LAYOUT = TextLayout()
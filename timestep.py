@@ -0,0 +1,47 @@
+# timestep.py
+
+SIM_RATE = 60  # Simulation steps per second, whatever the display rate
+SIM_STEP_MS = 1000 / SIM_RATE
+
+class FixedTimestep:
+    """Turns variable frame times into whole fixed-length simulation steps.
+
+    The time left over after the last step is kept for the next frame; alpha gives it as a
+    fraction of a step, for drawing positions between the previous and current states. A
+    frame that would need more than max_steps drops the excess, so slow frames make the game
+    run slower for a moment instead of each one needing more catch-up work than the last.
+    """
+
+    def __init__(self, step_ms=SIM_STEP_MS, max_steps=5):
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.reset()
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, elapsed_ms):
+        """Add a frame's elapsed time; returns how many steps to simulate."""
+        self.accumulator += elapsed_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            self.accumulator -= (steps - self.max_steps) * self.step_ms
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_ms
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step_ms
+
+def interpolate(previous, current, alpha, snap_distance=64):
+    """Point alpha of the way from previous to current; jumps longer than snap_distance,
+    such as respawns and knock-backs, and things with no previous position yet are drawn
+    at the current position straight away."""
+    if previous is None:
+        return current[0], current[1]
+    dx = current[0] - previous[0]
+    dy = current[1] - previous[1]
+    if abs(dx) > snap_distance or abs(dy) > snap_distance:
+        return current[0], current[1]
+    return previous[0] + dx * alpha, previous[1] + dy * alpha
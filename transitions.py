@@ -0,0 +1,68 @@
+# transitions.py
+
+import pygame
+
+FADE_MAX = 255
+
+def linear(progress):
+    return progress
+
+def smoothstep(progress):
+    return progress * progress * (3 - 2 * progress)
+
+def fade_duration(fade_speed, fps=60):
+    """Milliseconds an old per-frame alpha step of fade_speed took at fps."""
+    return int(FADE_MAX / fade_speed * 1000 / fps)
+
+class TransitionCompositor:
+    """Fades a scene to or from a solid colour through one preallocated overlay, timed by the clock."""
+
+    def __init__(self, size, color):
+        self.overlay = pygame.Surface(size).convert()
+        self.overlay.fill(color)
+        self.start_time = None  # Ticks when the running transition started
+        self.duration = 0
+        self.fade_in = True
+        self.curve = linear
+
+    @property
+    def active(self):
+        return self.start_time is not None
+
+    def start(self, fade_in, duration, curve=linear):
+        """Begin fading in from the colour (fade_in=True) or out to it."""
+        self.start_time = pygame.time.get_ticks()
+        self.duration = max(1, duration)
+        self.fade_in = fade_in
+        self.curve = curve
+
+    def alpha(self):
+        """Overlay opacity for the current moment of the transition."""
+        if not self.active:
+            return 0
+        progress = min(1.0, (pygame.time.get_ticks() - self.start_time) / self.duration)
+        opacity = self.curve(progress)
+        if self.fade_in:
+            opacity = 1 - opacity
+        return int(FADE_MAX * opacity)
+
+    def apply(self, surface):
+        """Composite the overlay onto a finished frame; ends the transition once its time is up."""
+        if not self.active:
+            return
+        alpha = self.alpha()
+        if alpha:
+            self.overlay.set_alpha(alpha)
+            surface.blit(self.overlay, (0, 0))
+        if pygame.time.get_ticks() - self.start_time >= self.duration:
+            self.start_time = None
+
+    def frames(self, surface, draw, present, fade_in, duration, curve=linear):
+        """Play a whole transition under the caller's frame loop: yields before each frame,
+        then redraws the scene with draw(surface) and presents it."""
+        self.start(fade_in, duration, curve)
+        while self.active:
+            yield
+            draw(surface)
+            self.apply(surface)
+            present(surface)
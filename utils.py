@@ -3,6 +3,7 @@
 import pygame
 import os
 import sys
+from text_layout import TEXT_LAYOUT
 
 # Constants for colors
 WHITE = (255, 255, 255)
@@ -30,28 +31,8 @@ def resource_path(relative_path):
     return os.path.join(base_path, 'assets', relative_path)
 
 def render_text_wrapped(surface, text, font, color, rect, bg_color=None):
-    words = text.split()
-    lines = []
-    line = ""
-    for word in words:
-        test_line = line + word + " "
-        text_width, _ = font.size(test_line)
-        if text_width < rect.width:
-            line = test_line
-        else:
-            lines.append(line)
-            line = word + " "
-    if line:
-        lines.append(line)
-    
-    y = rect.top
-    for line in lines:
-        if bg_color:
-            text_surface = font.render(line.strip(), True, color, bg_color)
-        else:
-            text_surface = font.render(line.strip(), True, color)
-        surface.blit(text_surface, (rect.left, y))
-        y += font.get_linesize()
+    """Draw text word-wrapped to rect through the shared layout cache."""
+    return TEXT_LAYOUT.draw(surface, text, font, color, rect, bg_color)
 
 def scale_pos(x, y, scale_factor_x, scale_factor_y):
     """Helper function to scale coordinates"""